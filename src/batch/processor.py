@@ -4,7 +4,13 @@ Processamento em lote de multiplos arquivos XML de workflow.
 Suporta workflows Alteryx e packages ODI simultaneamente.
 """
 import logging
+import os
+import pickle
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from itertools import repeat
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -18,6 +24,9 @@ logger = logging.getLogger(__name__)
 ALTERYX_EXTENSIONS = {".yxmd", ".yxmc", ".yxwz"}
 ODI_EXTENSIONS = {".xml"}
 
+WORKERS_ENV_VAR = "QOL_BATCH_WORKERS"
+PARALLEL_MIN_FILES = 8
+
 
 @dataclass
 class BatchResult:
@@ -81,12 +90,37 @@ class BatchProcessor:
 
         config.output_dir.mkdir(parents=True, exist_ok=True)
 
-        for idx, filepath in enumerate(files):
+        workers = _batch_workers(result.total_files)
+        if workers > 1:
+            self._process_parallel(files, config, workers, result, progress_fn, log_fn)
+        else:
+            self._process_serial(files, config, result, progress_fn, log_fn)
+
+        if log_fn:
+            log_fn(
+                f"Lote concluido: {result.processed} ok, {result.failed} falhas, "
+                f"{result.skipped} ignorados",
+                "success" if result.failed == 0 else "warning",
+            )
+
+        return result
+
+    def _process_serial(
+        self,
+        files: list[Path],
+        config: BatchConfig,
+        result: BatchResult,
+        progress_fn: Optional[Callable[[float], None]] = None,
+        log_fn: Optional[Callable[[str, str], None]] = None,
+        start: int = 0,
+    ) -> None:
+        """Processa os arquivos um a um no processo atual, a partir do indice start."""
+        for idx, filepath in enumerate(files[start:], start):
             try:
                 if log_fn:
                     log_fn(f"Processando [{idx + 1}/{result.total_files}]: {filepath.name}", "info")
 
-                file_result = self._process_single(filepath, config, log_fn)
+                file_result = self.process_file(filepath, config, log_fn)
                 result.results.append(file_result)
                 result.processed += 1
 
@@ -101,14 +135,83 @@ class BatchProcessor:
             if progress_fn:
                 progress_fn((idx + 1) / result.total_files)
 
+    def _process_parallel(
+        self,
+        files: list[Path],
+        config: BatchConfig,
+        workers: int,
+        result: BatchResult,
+        progress_fn: Optional[Callable[[float], None]] = None,
+        log_fn: Optional[Callable[[str, str], None]] = None,
+    ) -> None:
+        """Distribui os arquivos entre processos; resultados e logs chegam na ordem original.
+
+        Se o pool quebrar (worker encerrado, falta de memoria) ou um item nao puder ser
+        serializado, os arquivos restantes sao processados em serie no processo atual.
+        """
+        # Uma config nao serializavel falha na thread de envio do pool e trava o shutdown,
+        # por isso e verificada antes de criar os processos
+        try:
+            pickle.dumps(config)
+        except _POOL_ERRORS as exc:
+            self._fall_back_to_serial(exc, files, config, result, progress_fn, log_fn, 0)
+            return
+
+        total = result.total_files
+        chunksize = max(1, total // (workers * 4))
+        done = 0
+        failure: BaseException | None = None
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            outcomes = _iter_outcomes(executor, files, config, chunksize)
+            for idx, filepath in enumerate(files):
+                try:
+                    file_result, error, messages = next(outcomes)
+                except _POOL_ERRORS as exc:
+                    failure = exc
+                    executor.shutdown(cancel_futures=True)
+                    break
+
+                if log_fn:
+                    log_fn(f"Processando [{idx + 1}/{total}]: {filepath.name}", "info")
+                    for message, level in messages:
+                        log_fn(message, level)
+
+                if file_result is not None:
+                    result.results.append(file_result)
+                    result.processed += 1
+                else:
+                    error_msg = f"Erro em {filepath.name}: {error}"
+                    result.errors.append(error_msg)
+                    result.failed += 1
+                    if log_fn:
+                        log_fn(error_msg, "error")
+
+                done = idx + 1
+                if progress_fn:
+                    progress_fn(done / total)
+
+        if failure is not None:
+            self._fall_back_to_serial(failure, files, config, result, progress_fn, log_fn, done)
+
+    def _fall_back_to_serial(
+        self,
+        failure: BaseException,
+        files: list[Path],
+        config: BatchConfig,
+        result: BatchResult,
+        progress_fn: Optional[Callable[[float], None]],
+        log_fn: Optional[Callable[[str, str], None]],
+        start: int,
+    ) -> None:
+        """Registra a falha do pool e processa em serie os arquivos a partir de start."""
+        logger.error("Processamento paralelo interrompido: %r", failure)
         if log_fn:
             log_fn(
-                f"Lote concluido: {result.processed} ok, {result.failed} falhas, "
-                f"{result.skipped} ignorados",
-                "success" if result.failed == 0 else "warning",
+                f"Processamento paralelo interrompido ({failure}); continuando em serie",
+                "warning",
             )
-
-        return result
+        self._process_serial(files, config, result, progress_fn, log_fn, start=start)
 
     def _collect_files(self, config: BatchConfig) -> list[Path]:
         """Coleta arquivos para processar baseado na configuracao."""
@@ -122,13 +225,16 @@ class BatchProcessor:
 
         return files
 
-    def _process_single(
+    def process_file(
         self,
         filepath: Path,
         config: BatchConfig,
         log_fn: Optional[Callable] = None,
     ) -> dict:
-        """Processa um unico arquivo."""
+        """Processa um unico arquivo conforme config.operation e retorna seus metadados.
+
+        Usado tanto pelo lote serial quanto pelos workers do lote paralelo.
+        """
         result_data: dict = {
             "filepath": str(filepath),
             "status": "ok",
@@ -205,5 +311,65 @@ class BatchProcessor:
         return self.process(config, log_fn=log_fn)
 
 
+def _batch_workers(total_files: int) -> int:
+    """Define quantos processos usar; QOL_BATCH_WORKERS sobrepoe o padrao."""
+    env_value = os.environ.get(WORKERS_ENV_VAR, "")
+    if env_value.isdigit():
+        workers = int(env_value)
+    elif total_files >= PARALLEL_MIN_FILES:
+        workers = os.cpu_count() or 1
+    else:
+        workers = 1
+    return max(1, min(workers, total_files))
+
+
+_worker_processor: Optional[BatchProcessor] = None
+
+_Outcome = tuple[Optional[dict], Optional[str], list[tuple[str, str]]]
+
+# Falhas do pool em si: worker encerrado, ou tarefa/resultado que nao pode ser serializado
+# (o pool costuma relancar TypeError "cannot pickle ..." em vez de PicklingError)
+_POOL_ERRORS = (BrokenProcessPool, pickle.PicklingError, TypeError, AttributeError)
+
+
+def _init_worker() -> None:
+    """Cria os parsers e conversores uma vez por processo worker."""
+    global _worker_processor
+    _worker_processor = BatchProcessor()
+
+
+def _iter_outcomes(
+    executor: ProcessPoolExecutor, files: list[Path], config: BatchConfig, chunksize: int
+) -> Iterator[_Outcome]:
+    """Gera os resultados do pool na ordem dos arquivos; falhas do pool surgem no next()."""
+    yield from executor.map(
+        _process_one, files, repeat(config, len(files)), chunksize=chunksize
+    )
+
+
+def _process_one(filepath: Path, config: BatchConfig) -> _Outcome:
+    """Ponto de entrada dos workers: processa um arquivo via BatchProcessor.process_file.
+
+    Devolve (resultado, erro, mensagens de log); as mensagens sao repassadas ao log_fn no
+    processo principal, na ordem dos arquivos.
+    """
+    messages: list[tuple[str, str]] = []
+
+    def collect(message: str, level: str = "info") -> None:
+        messages.append((message, level))
+
+    global _worker_processor
+    processor = _worker_processor
+    if processor is None:
+        processor = _worker_processor = BatchProcessor()
+
+    try:
+        file_result = processor.process_file(filepath, config, collect)
+    except Exception as exc:
+        logger.exception("Erro ao processar %s", filepath.name)
+        return None, str(exc), messages
+    return file_result, None, messages
+
+
 # "A perfeicao e alcancada nao quando nao ha mais nada a acrescentar, mas quando nao ha mais nada a retirar." - Saint-Exupery
 
@@ -67,6 +67,7 @@ def _add_convert_command(subparsers: argparse._SubParsersAction) -> None:
         required=True,
         help="Direcao da conversao: a2o (Alteryx->ODI) ou o2a (ODI->Alteryx)",
     )
+    cmd.add_argument("--pretty", action="store_true", help="Indenta o XML gerado")
 
 
 def _add_template_command(subparsers: argparse._SubParsersAction) -> None:
@@ -163,7 +164,7 @@ def _run_convert(args: argparse.Namespace) -> int:
         if output_path is None:
             output_path = input_path.parent / f"{input_path.stem}_alteryx.yxmd"
 
-    result = converter.convert(input_path, output_path)
+    result = converter.convert(input_path, output_path, pretty=args.pretty)
 
     if result.success:
         logger.info("Conversao concluida: %s", output_path)
@@ -271,10 +272,10 @@ _COMMAND_MAP: dict[str, callable] = {
 }
 
 
-def run_cli() -> int:
-    """Ponto de entrada principal do CLI."""
+def run_cli(argv: list[str] | None = None) -> int:
+    """Ponto de entrada principal do CLI; sem argv, usa sys.argv[1:]."""
     parser = _build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     verbosity_map = {0: Verbosity.NORMAL, 1: Verbosity.VERBOSE, 2: Verbosity.DEBUG}
     verbosity = verbosity_map.get(args.verbose, Verbosity.DEBUG)
@@ -6,12 +6,16 @@ Extrai metadados de nodes, connections e tool configurations.
 """
 import logging
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from xml.etree import ElementTree as ET
 
 logger = logging.getLogger(__name__)
 
+PARSE_CACHE_SIZE = 128
+
 
 class AlteryxWorkflow:
     """Representacao estruturada de um workflow Alteryx."""
@@ -44,22 +48,35 @@ class AlteryxParser:
 
     def __init__(self) -> None:
         self._cache: dict[str, AlteryxWorkflow] = {}
+        self._parse_cached = lru_cache(maxsize=PARSE_CACHE_SIZE)(self._parse_file)
 
     def parse(self, filepath: Path) -> AlteryxWorkflow:
-        """Faz parsing de um arquivo Alteryx XML e retorna o workflow estruturado."""
+        """Faz parsing de um arquivo Alteryx XML e retorna o workflow estruturado.
+
+        O cache e indexado por (caminho, mtime_ns, tamanho): o mesmo arquivo inalterado
+        devolve o mesmo workflow, e uma alteracao no disco forca novo parsing.
+        """
         filepath = Path(filepath)
         cache_key = str(filepath.resolve())
 
-        if cache_key in self._cache:
-            logger.info("Usando cache para: %s", filepath.name)
-            return self._cache[cache_key]
-
-        if not filepath.exists():
-            raise FileNotFoundError(f"Arquivo nao encontrado: {filepath}")
+        try:
+            stat = filepath.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Arquivo nao encontrado: {filepath}") from None
 
         if filepath.suffix.lower() not in self.SUPPORTED_EXTENSIONS:
             raise ValueError(f"Extensao nao suportada: {filepath.suffix}")
 
+        previous = self._cache.get(cache_key)
+        workflow = self._parse_cached(cache_key, stat.st_mtime_ns, stat.st_size)
+        if workflow is previous:
+            logger.info("Usando cache para: %s", filepath.name)
+        self._cache[cache_key] = workflow
+        return workflow
+
+    def _parse_file(self, path: str, mtime_ns: int, size: int) -> AlteryxWorkflow:
+        """Faz o parsing efetivo; mtime_ns e size entram apenas na chave do cache."""
+        filepath = Path(path)
         workflow = AlteryxWorkflow(filepath)
 
         try:
@@ -74,7 +91,6 @@ class AlteryxParser:
         workflow.connections = self._extract_connections(workflow.root)
         workflow._parsed = True
 
-        self._cache[cache_key] = workflow
         logger.info(
             "Parsed: %s (%d nodes, %d connections)",
             filepath.name,
@@ -113,7 +129,11 @@ class AlteryxParser:
 
             gui_settings = node.find("GuiSettings")
             if gui_settings is not None:
-                node_data["gui_settings"] = dict(gui_settings.attrib)
+                attrs = dict(gui_settings.attrib)
+                plugin = attrs.get("Plugin")
+                if plugin:
+                    attrs["Plugin"] = sys.intern(plugin)
+                node_data["gui_settings"] = attrs
 
             for prop in node.iter("Configuration"):
                 for child in prop:
@@ -168,10 +188,13 @@ class AlteryxParser:
     def clear_cache(self) -> None:
         """Limpa o cache de workflows parseados."""
         self._cache.clear()
+        self._parse_cached.cache_clear()
         logger.info("Cache de parser limpo")
 
-    def parse_from_string(self, xml_content: str, name: str = "memory") -> AlteryxWorkflow:
-        """Faz parsing de conteudo XML a partir de uma string."""
+    def parse_from_string(
+        self, xml_content: str | bytes, name: str = "memory"
+    ) -> AlteryxWorkflow:
+        """Faz parsing de conteudo XML a partir de uma string ou bytes."""
         workflow = AlteryxWorkflow(Path(name))
 
         try:
@@ -5,7 +5,9 @@ Mapeia estruturas de workflow para package e vice-versa.
 """
 from dataclasses import dataclass, field
 import logging
+import sys
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 from xml.etree import ElementTree as ET
 
@@ -16,28 +18,42 @@ from src.core.parser import RegexCache
 logger = logging.getLogger(__name__)
 
 
-TOOL_TO_STEP_MAP = {
-    "AlteryxBasePluginsGui.DbFileInput.DbFileInput": "DataStoreCommand",
-    "AlteryxBasePluginsGui.DbFileOutput.DbFileOutput": "DataStoreCommand",
-    "AlteryxBasePluginsGui.Filter.Filter": "ProcedureCommand",
-    "AlteryxBasePluginsGui.Formula.Formula": "ProcedureCommand",
-    "AlteryxBasePluginsGui.Join.Join": "ProcedureCommand",
-    "AlteryxBasePluginsGui.Sort.Sort": "ProcedureCommand",
-    "AlteryxBasePluginsGui.Summarize.Summarize": "ProcedureCommand",
-    "AlteryxBasePluginsGui.Union.Union": "ProcedureCommand",
-}
-
-STEP_TO_TOOL_MAP = {
-    "DataStoreCommand": "AlteryxBasePluginsGui.DbFileInput.DbFileInput",
-    "ProcedureCommand": "AlteryxBasePluginsGui.Formula.Formula",
-    "OdiCommand": "AlteryxBasePluginsGui.RunCommand.RunCommand",
-    "VariableStep": "AlteryxBasePluginsGui.Formula.Formula",
-}
+# Somente leitura, com chaves internadas: o Plugin vindo do parser tambem e internado,
+# entao a busca resolve por identidade.
+TOOL_TO_STEP_MAP = MappingProxyType({
+    sys.intern(k): sys.intern(v)
+    for k, v in {
+        "AlteryxBasePluginsGui.DbFileInput.DbFileInput": "DataStoreCommand",
+        "AlteryxBasePluginsGui.DbFileOutput.DbFileOutput": "DataStoreCommand",
+        "AlteryxBasePluginsGui.Filter.Filter": "ProcedureCommand",
+        "AlteryxBasePluginsGui.Formula.Formula": "ProcedureCommand",
+        "AlteryxBasePluginsGui.Join.Join": "ProcedureCommand",
+        "AlteryxBasePluginsGui.Sort.Sort": "ProcedureCommand",
+        "AlteryxBasePluginsGui.Summarize.Summarize": "ProcedureCommand",
+        "AlteryxBasePluginsGui.Union.Union": "ProcedureCommand",
+    }.items()
+})
+STEP_TO_TOOL_MAP = MappingProxyType({
+    sys.intern(k): sys.intern(v)
+    for k, v in {
+        "DataStoreCommand": "AlteryxBasePluginsGui.DbFileInput.DbFileInput",
+        "ProcedureCommand": "AlteryxBasePluginsGui.Formula.Formula",
+        "OdiCommand": "AlteryxBasePluginsGui.RunCommand.RunCommand",
+        "VariableStep": "AlteryxBasePluginsGui.Formula.Formula",
+    }.items()
+})
 
 _KNOWN_TOOL_PLUGINS = frozenset(TOOL_TO_STEP_MAP.keys())
 _KNOWN_STEP_TYPES = frozenset(STEP_TO_TOOL_MAP.keys())
 
 
+def _serialize(root: ET.Element, pretty: bool = False) -> str:
+    """Serializa o XML de saida; a indentacao so e aplicada quando solicitada."""
+    if pretty:
+        ET.indent(root)
+    return ET.tostring(root, encoding="unicode", xml_declaration=True)
+
+
 @dataclass
 class ConversionResult:
     """Resultado de uma conversao entre formatos."""
@@ -55,16 +71,38 @@ class AlteryxToOdiConverter:
     def __init__(self) -> None:
         self._parser = AlteryxParser()
 
-    def convert(self, input_path: Path, output_path: Optional[Path] = None) -> ConversionResult:
-        """Converte um workflow Alteryx para ODI XML."""
+    def convert(
+        self,
+        input_path: Path,
+        output_path: Optional[Path] = None,
+        *,
+        workflow: Optional[AlteryxWorkflow] = None,
+        pretty: bool = False,
+    ) -> ConversionResult:
+        """Converte um workflow Alteryx para ODI XML.
+
+        Se ``workflow`` ja parseado for informado, o arquivo de entrada nao e relido.
+        """
+        if workflow is None:
+            try:
+                workflow = self._parser.parse(input_path)
+            except Exception as exc:
+                result = ConversionResult(success=False)
+                result.errors.append(f"Falha ao parsear Alteryx: {exc}")
+                return result
+
+        return self.convert_from_workflow(workflow, output_path, pretty=pretty)
+
+    def convert_from_workflow(
+        self,
+        workflow: AlteryxWorkflow,
+        output_path: Optional[Path] = None,
+        *,
+        pretty: bool = False,
+    ) -> ConversionResult:
+        """Converte um workflow ja parseado, sem reler o arquivo de entrada."""
         result = ConversionResult(success=False)
 
-        try:
-            workflow = self._parser.parse(input_path)
-        except Exception as exc:
-            result.errors.append(f"Falha ao parsear Alteryx: {exc}")
-            return result
-
         if workflow.root is None:
             result.errors.append("Workflow sem root element")
             return result
@@ -112,7 +150,7 @@ class AlteryxToOdiConverter:
             flow.set("From", f"Step_{conn['origin_tool_id']}")
             flow.set("To", f"Step_{conn['dest_tool_id']}")
 
-        result.xml_content = ET.tostring(odi_root, encoding="unicode", xml_declaration=True)
+        result.xml_content = _serialize(odi_root, pretty)
         result.stats = {
             "tools_converted": converted_count,
             "tools_skipped": skipped_count,
@@ -142,7 +180,13 @@ class OdiToAlteryxConverter:
     def __init__(self) -> None:
         self._parser = OdiParser()
 
-    def convert(self, input_path: Path, output_path: Optional[Path] = None) -> ConversionResult:
+    def convert(
+        self,
+        input_path: Path,
+        output_path: Optional[Path] = None,
+        *,
+        pretty: bool = False,
+    ) -> ConversionResult:
         """Converte um package ODI para workflow Alteryx XML."""
         result = ConversionResult(success=False)
 
@@ -202,7 +246,7 @@ class OdiToAlteryxConverter:
             dest.set("ToolID", str(idx + 2))
             dest.set("Connection", "Input")
 
-        result.xml_content = ET.tostring(alteryx_root, encoding="unicode", xml_declaration=True)
+        result.xml_content = _serialize(alteryx_root, pretty)
         result.stats = {
             "steps_converted": converted_count,
             "steps_skipped": skipped_count,
@@ -5,12 +5,17 @@ Extrai metadados de scenarios, packages, interfaces e steps.
 """
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, Optional
 from xml.etree import ElementTree as ET
 
 logger = logging.getLogger(__name__)
 
+PARSE_CACHE_SIZE = 128
+
+_HEADER_FIELDS = {"Description": "description", "Folder": "folder", "Project": "project"}
+
 
 @dataclass
 class OdiScenario:
@@ -78,38 +83,40 @@ class OdiParser:
 
     def __init__(self) -> None:
         self._cache: dict[str, OdiPackage] = {}
+        self._parse_cached = lru_cache(maxsize=PARSE_CACHE_SIZE)(self._parse_file)
 
     def parse(self, filepath: Path) -> OdiPackage:
-        """Faz parsing de um arquivo ODI XML e retorna o package estruturado."""
+        """Faz parsing de um arquivo ODI XML e retorna o package estruturado.
+
+        O cache e indexado por (caminho, mtime_ns, tamanho), como no AlteryxParser.
+        """
         filepath = Path(filepath)
         cache_key = str(filepath.resolve())
 
-        if cache_key in self._cache:
-            logger.info("Usando cache para: %s", filepath.name)
-            return self._cache[cache_key]
+        try:
+            stat = filepath.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Arquivo nao encontrado: {filepath}") from None
 
-        if not filepath.exists():
-            raise FileNotFoundError(f"Arquivo nao encontrado: {filepath}")
+        previous = self._cache.get(cache_key)
+        package = self._parse_cached(cache_key, stat.st_mtime_ns, stat.st_size)
+        if package is previous:
+            logger.info("Usando cache para: %s", filepath.name)
+        self._cache[cache_key] = package
+        return package
 
+    def _parse_file(self, path: str, mtime_ns: int, size: int) -> OdiPackage:
+        """Faz o parsing efetivo; mtime_ns e size entram apenas na chave do cache."""
+        filepath = Path(path)
         package = OdiPackage(name=filepath.stem, filepath=filepath)
 
         try:
-            tree = ET.parse(str(filepath))
-            root = tree.getroot()
+            with open(filepath, "rb") as fh:
+                self._consume_events(ET.iterparse(fh, events=("start", "end")), package)
         except ET.ParseError as exc:
             logger.error("Falha ao parsear ODI XML: %s - %s", filepath.name, exc)
             raise
 
-        package.version = self._extract_attribute(root, "Version", "")
-        package.description = self._extract_text(root, "Description")
-        package.folder = self._extract_text(root, "Folder")
-        package.project = self._extract_text(root, "Project")
-        package.steps = self._extract_steps(root)
-        package.scenarios = self._extract_scenarios(root)
-        package.interfaces = self._extract_interfaces(root)
-        package.variables = self._extract_variables(root)
-
-        self._cache[cache_key] = package
         logger.info(
             "Parsed ODI: %s (%d steps, %d scenarios)",
             filepath.name,
@@ -118,6 +125,49 @@ class OdiParser:
         )
         return package
 
+    def _consume_events(
+        self, events: Iterable[tuple[Any, ...]], package: OdiPackage
+    ) -> None:
+        """Preenche o package a partir dos eventos start/end do iterparse.
+
+        Steps, scenarios e interfaces reservam sua posicao no start (mesma ordem de
+        root.iter) e sao montados no end, com a subarvore completa. Elementos fora desses
+        containers sao descartados ao terminar, limitando a memoria ao maior container.
+        """
+        builders: dict[str, tuple[list, Callable[[ET.Element], object]]] = {
+            "Step": (package.steps, self._build_step),
+            "Scenario": (package.scenarios, self._build_scenario),
+            "Interface": (package.interfaces, self._build_interface),
+        }
+        open_elems: list[ET.Element] = []
+        slots: list[int] = []
+        header_elems: dict[str, ET.Element] = {}
+
+        for event, elem in events:
+            tag = elem.tag
+            if event == "start":
+                if not open_elems:
+                    package.version = self._extract_attribute(elem, "Version", "")
+                elif tag in _HEADER_FIELDS and tag not in header_elems:
+                    header_elems[tag] = elem
+                if tag == "Variable":
+                    self._add_variable(package.variables, elem)
+                if tag in builders:
+                    target = builders[tag][0]
+                    slots.append(len(target))
+                    target.append(None)
+                open_elems.append(elem)
+                continue
+
+            open_elems.pop()
+            if tag in builders:
+                target, build = builders[tag]
+                target[slots.pop()] = build(elem)
+            if tag in header_elems and header_elems[tag] is elem:
+                setattr(package, _HEADER_FIELDS[tag], elem.text.strip() if elem.text else "")
+            if not slots and open_elems:
+                del open_elems[-1][-1]
+
     def _extract_attribute(self, elem: ET.Element, attr: str, default: str = "") -> str:
         """Extrai um atributo de um elemento."""
         return elem.get(attr, default)
@@ -129,132 +179,109 @@ class OdiParser:
             return elem.text.strip()
         return ""
 
-    def _extract_steps(self, root: ET.Element) -> list[OdiStep]:
-        """Extrai steps de um package ODI."""
-        steps: list[OdiStep] = []
-
-        for step_elem in root.iter("Step"):
-            step = OdiStep(
-                name=step_elem.get("Name", ""),
-                step_type=step_elem.get("Type", ""),
-            )
-
-            command_elem = step_elem.find("Command")
-            if command_elem is not None and command_elem.text:
-                step.command = command_elem.text.strip()
-
-            scenario_ref = step_elem.find("ScenarioRef")
-            if scenario_ref is not None:
-                step.target_scenario = scenario_ref.get("Name", "")
-
-            success_elem = step_elem.find("OnSuccess")
-            if success_elem is not None:
-                step.on_success = success_elem.get("NextStep", "")
-
-            failure_elem = step_elem.find("OnFailure")
-            if failure_elem is not None:
-                step.on_failure = failure_elem.get("NextStep", "")
-
-            steps.append(step)
-
-        return steps
-
-    def _extract_scenarios(self, root: ET.Element) -> list[OdiScenario]:
-        """Extrai cenarios referenciados no package."""
-        scenarios: list[OdiScenario] = []
-
-        for scenario_elem in root.iter("Scenario"):
-            scenario = OdiScenario(
-                name=scenario_elem.get("Name", ""),
-                version=scenario_elem.get("Version", ""),
-            )
-
-            desc = scenario_elem.find("Description")
-            if desc is not None and desc.text:
-                scenario.description = desc.text.strip()
-
-            folder = scenario_elem.find("Folder")
-            if folder is not None and folder.text:
-                scenario.folder = folder.text.strip()
-
-            for var_elem in scenario_elem.iter("Variable"):
-                var_name = var_elem.get("Name", "")
-                if var_name:
-                    scenario.variables.append(var_name)
-
-            scenarios.append(scenario)
-
-        return scenarios
-
-    def _extract_interfaces(self, root: ET.Element) -> list[OdiInterface]:
-        """Extrai interfaces definidas no package."""
-        interfaces: list[OdiInterface] = []
-
-        for iface_elem in root.iter("Interface"):
-            iface = OdiInterface(
-                name=iface_elem.get("Name", ""),
-            )
-
-            source = iface_elem.find("Source")
-            if source is not None:
-                iface.source_schema = source.get("Schema", "")
-                iface.source_table = source.get("Table", "")
-
-            target = iface_elem.find("Target")
-            if target is not None:
-                iface.target_schema = target.get("Schema", "")
-                iface.target_table = target.get("Table", "")
-
-            iface.integration_type = self._extract_text(iface_elem, "IntegrationType")
-
-            for mapping_elem in iface_elem.iter("Mapping"):
-                mapping = {
-                    "source_col": mapping_elem.get("SourceColumn", ""),
-                    "target_col": mapping_elem.get("TargetColumn", ""),
-                    "expression": mapping_elem.get("Expression", ""),
-                }
-                iface.mappings.append(mapping)
-
-            interfaces.append(iface)
-
-        return interfaces
-
-    def _extract_variables(self, root: ET.Element) -> dict:
-        """Extrai variaveis definidas no package."""
-        variables: dict = {}
-        for var_elem in root.iter("Variable"):
-            name = var_elem.get("Name", "")
-            default = var_elem.get("Default", "")
-            var_type = var_elem.get("Type", "")
-            if name:
-                variables[name] = {
-                    "default": default,
-                    "type": var_type,
-                }
-        return variables
-
-    def parse_from_string(self, xml_content: str, name: str = "memory") -> OdiPackage:
-        """Faz parsing de conteudo ODI XML a partir de uma string."""
+    def _build_step(self, step_elem: ET.Element) -> OdiStep:
+        """Monta um step a partir do seu elemento."""
+        step = OdiStep(
+            name=step_elem.get("Name", ""),
+            step_type=step_elem.get("Type", ""),
+        )
+
+        command_elem = step_elem.find("Command")
+        if command_elem is not None and command_elem.text:
+            step.command = command_elem.text.strip()
+
+        scenario_ref = step_elem.find("ScenarioRef")
+        if scenario_ref is not None:
+            step.target_scenario = scenario_ref.get("Name", "")
+
+        success_elem = step_elem.find("OnSuccess")
+        if success_elem is not None:
+            step.on_success = success_elem.get("NextStep", "")
+
+        failure_elem = step_elem.find("OnFailure")
+        if failure_elem is not None:
+            step.on_failure = failure_elem.get("NextStep", "")
+
+        return step
+
+    def _build_scenario(self, scenario_elem: ET.Element) -> OdiScenario:
+        """Monta um cenario referenciado no package."""
+        scenario = OdiScenario(
+            name=scenario_elem.get("Name", ""),
+            version=scenario_elem.get("Version", ""),
+        )
+
+        desc = scenario_elem.find("Description")
+        if desc is not None and desc.text:
+            scenario.description = desc.text.strip()
+
+        folder = scenario_elem.find("Folder")
+        if folder is not None and folder.text:
+            scenario.folder = folder.text.strip()
+
+        for var_elem in scenario_elem.iter("Variable"):
+            var_name = var_elem.get("Name", "")
+            if var_name:
+                scenario.variables.append(var_name)
+
+        return scenario
+
+    def _build_interface(self, iface_elem: ET.Element) -> OdiInterface:
+        """Monta uma interface definida no package."""
+        iface = OdiInterface(
+            name=iface_elem.get("Name", ""),
+        )
+
+        source = iface_elem.find("Source")
+        if source is not None:
+            iface.source_schema = source.get("Schema", "")
+            iface.source_table = source.get("Table", "")
+
+        target = iface_elem.find("Target")
+        if target is not None:
+            iface.target_schema = target.get("Schema", "")
+            iface.target_table = target.get("Table", "")
+
+        iface.integration_type = self._extract_text(iface_elem, "IntegrationType")
+
+        for mapping_elem in iface_elem.iter("Mapping"):
+            mapping = {
+                "source_col": mapping_elem.get("SourceColumn", ""),
+                "target_col": mapping_elem.get("TargetColumn", ""),
+                "expression": mapping_elem.get("Expression", ""),
+            }
+            iface.mappings.append(mapping)
+
+        return iface
+
+    def _add_variable(self, variables: dict, var_elem: ET.Element) -> None:
+        """Registra uma variavel definida no package."""
+        name = var_elem.get("Name", "")
+        if name:
+            variables[name] = {
+                "default": var_elem.get("Default", ""),
+                "type": var_elem.get("Type", ""),
+            }
+
+    def parse_from_string(self, xml_content: str | bytes, name: str = "memory") -> OdiPackage:
+        """Faz parsing de conteudo ODI XML a partir de uma string ou bytes."""
         package = OdiPackage(name=name, filepath=Path(name))
 
+        pull_parser: ET.XMLPullParser = ET.XMLPullParser(events=("start", "end"))
         try:
-            root = ET.fromstring(xml_content)
+            pull_parser.feed(xml_content)
+            pull_parser.close()
         except ET.ParseError as exc:
             logger.error("Falha ao parsear ODI XML string: %s", exc)
             raise
 
-        package.version = self._extract_attribute(root, "Version", "")
-        package.description = self._extract_text(root, "Description")
-        package.steps = self._extract_steps(root)
-        package.scenarios = self._extract_scenarios(root)
-        package.interfaces = self._extract_interfaces(root)
-        package.variables = self._extract_variables(root)
-
+        self._consume_events(pull_parser.read_events(), package)
         return package
 
     def clear_cache(self) -> None:
         """Limpa o cache de packages parseados."""
         self._cache.clear()
+        self._parse_cached.cache_clear()
         logger.info("Cache ODI limpo")
 
 
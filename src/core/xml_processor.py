@@ -5,6 +5,7 @@ Usa XML parsing para modificar APENAS Tool IDs especificos, preservando demais d
 """
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional, Tuple
 from xml.etree import ElementTree as ET
@@ -15,6 +16,8 @@ logger = logging.getLogger(__name__)
 
 _regex_cache = RegexCache()
 
+TEMPLATE_CACHE_SIZE = 16
+
 
 RULES: dict[str, dict] = {
     "gerar-fechamento-diario.yxmd": {
@@ -56,6 +59,16 @@ def find_node_by_tool_id(root: ET.Element, tool_id: str) -> Optional[ET.Element]
     return None
 
 
+def index_nodes_by_tool_id(root: ET.Element) -> dict[str, ET.Element]:
+    """Indexa os Node elements por ToolID em uma unica passada (primeira ocorrencia vence)."""
+    index: dict[str, ET.Element] = {}
+    for node in root.iter("Node"):
+        tool_id = node.get("ToolID")
+        if tool_id is not None:
+            index.setdefault(tool_id, node)
+    return index
+
+
 def find_nodes_by_annotation_text(root: ET.Element, annotation_text: str, *, case_sensitive: bool = True) -> list[ET.Element]:
     """Encontra todos os nodes que contem texto de anotacao especificado."""
     matching: list[ET.Element] = []
@@ -194,8 +207,30 @@ def process_template(
     """
     Processa um template aplicando modificacoes cirurgicas.
     Modifica apenas Tool IDs especificos conforme definido em RULES.
+    O resultado e memoizado por (conteudo, template, servidor, ano, mes); as mensagens de
+    log sao gravadas na primeira execucao e repetidas em log_fn a cada chamada.
     """
-    template_name = template_path.name
+    with open(template_path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    output, stats, messages = _process_template_cached(
+        content, template_path.name, new_server, target_year, target_month
+    )
+    if log_fn:
+        for args in messages:
+            log_fn(*args)
+    return output, dict(stats)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _process_template_cached(
+    content: str,
+    template_name: str,
+    new_server: str,
+    target_year: int,
+    target_month: int,
+) -> Tuple[str, tuple, tuple]:
+    """Nucleo puro de process_template: (xml, itens de stats, mensagens de log)."""
     rules = RULES.get(template_name, {})
 
     stats: dict = {
@@ -203,49 +238,46 @@ def process_template(
         "dates": 0,
         "nodes_modified": 0,
     }
+    messages: list[tuple] = []
 
-    with open(template_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    def record(*args: str) -> None:
+        messages.append(args)
 
     try:
         root = ET.fromstring(content)
     except ET.ParseError as exc:
-        if log_fn:
-            log_fn(f"ERRO: Falha ao parsear XML - {exc}", "error")
-        return content, stats
+        record(f"ERRO: Falha ao parsear XML - {exc}", "error")
+        return content, tuple(stats.items()), tuple(messages)
 
-    if log_fn:
-        log_fn(f"Processando: {rules.get('name', template_name)}")
+    record(f"Processando: {rules.get('name', template_name)}")
 
     date_rules = rules.get("date_nodes", {})
+    nodes_by_id = index_nodes_by_tool_id(root)
 
     if "tool_ids" in date_rules:
         for tool_id in date_rules["tool_ids"]:
-            node = find_node_by_tool_id(root, tool_id)
+            node = nodes_by_id.get(tool_id)
             if node is not None:
-                count = update_node_dates(node, target_year, target_month, log_fn)
+                count = update_node_dates(node, target_year, target_month, record)
                 if count > 0:
                     stats["dates"] += count
                     stats["nodes_modified"] += 1
             else:
-                if log_fn:
-                    log_fn(f"  AVISO: ID {tool_id} nao encontrado", "warning")
+                record(f"  AVISO: ID {tool_id} nao encontrado", "warning")
 
     server_ids = rules.get("server_nodes", [])
     if server_ids and new_server:
-        if log_fn:
-            log_fn(f"  Atualizando servidor para: {new_server}")
+        record(f"  Atualizando servidor para: {new_server}")
 
         for tool_id in server_ids:
-            node = find_node_by_tool_id(root, tool_id)
+            node = nodes_by_id.get(tool_id)
             if node is not None:
-                count = update_node_server(node, new_server, log_fn)
+                count = update_node_server(node, new_server, record)
                 stats["servers"] += count
                 if count > 0:
                     stats["nodes_modified"] += 1
             else:
-                if log_fn:
-                    log_fn(f"  AVISO: ID {tool_id} (servidor) nao encontrado", "warning")
+                record(f"  AVISO: ID {tool_id} (servidor) nao encontrado", "warning")
 
     output = ET.tostring(root, encoding="unicode")
 
@@ -254,7 +286,7 @@ def process_template(
         if xml_decl_match:
             output = xml_decl_match.group(0) + output
 
-    return output, stats
+    return output, tuple(stats.items()), tuple(messages)
 
 
 def get_output_filename(input_filename: str) -> str:
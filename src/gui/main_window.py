@@ -7,7 +7,7 @@ import logging
 import tkinter as tk
 from datetime import datetime
 from pathlib import Path
-from tkinter import filedialog, messagebox, ttk
+from tkinter import ttk
 from typing import Callable, Optional
 
 from src.core.logger import AppLogger
@@ -30,37 +30,61 @@ PLACEHOLDER_TEXT = "Ex: caminho/para/arquivo.yxmd"
 PLACEHOLDER_COLOR = DRACULA_COMMENT
 NORMAL_COLOR = DRACULA_FG
 
+LOGS_DIR = Path(__file__).resolve().parents[2] / "logs"
 
-class MainWindow(tk.Tk):
+# Teclas que editariam o log; as demais (setas, Home/End, PageUp/PageDown) seguem para o Text
+_LOG_EDIT_KEYSYMS = frozenset({"BackSpace", "Delete", "Return", "KP_Enter"})
+_SHIFT_MASK = 0x0001
+_CONTROL_MASK = 0x0004
+
+
+class MainWindow:
     """Janela principal da aplicacao QoL Alteryx-ODI Tools."""
 
+    __slots__ = (
+        "root",
+        "style",
+        "logs_dir",
+        "_on_generate_callback",
+        "_on_convert_callback",
+        "_placeholder_active",
+        "_log_messages",
+        "operation_var",
+        "operation_combo",
+        "file_entry",
+        "month_var",
+        "month_combo",
+        "server_entry",
+        "execute_btn",
+        "clear_btn",
+        "log_textbox",
+        "progress_var",
+        "progress_bar",
+        "context_menu",
+    )
+
     def __init__(self) -> None:
-        super().__init__()
+        self.root = tk.Tk()
 
-        self.title("QoL Alteryx-ODI Tools")
-        self.geometry("900x800")
-        self.resizable(False, False)
-        self.configure(bg=DRACULA_BG)
+        self.root.title("QoL Alteryx-ODI Tools")
+        self.root.geometry("900x800")
+        self.root.resizable(False, False)
+        self.root.configure(bg=DRACULA_BG)
 
         self._on_generate_callback: Optional[Callable] = None
         self._on_convert_callback: Optional[Callable] = None
         self._placeholder_active = True
         self._log_messages: list[str] = []
 
-        self._setup_logs_folder()
+        self.logs_dir = LOGS_DIR
         AppLogger.setup(log_dir=self.logs_dir)
         self._setup_styles()
         self._setup_ui()
         logger.info("Interface inicializada")
 
-    def _setup_logs_folder(self) -> None:
-        """Cria pasta de logs no diretorio raiz."""
-        self.logs_dir = Path(__file__).parent.parent.parent / "logs"
-        self.logs_dir.mkdir(exist_ok=True)
-
     def _setup_styles(self) -> None:
         """Configura estilos ttk para tema Dracula."""
-        self.style = ttk.Style()
+        self.style = ttk.Style(self.root)
         self.style.theme_use("clam")
 
         self.style.configure("Dark.TFrame", background=DRACULA_BG)
@@ -110,11 +134,11 @@ class MainWindow(tk.Tk):
             selectforeground=[("readonly", DRACULA_FG)],
         )
 
-        self.option_add("*TCombobox*Listbox.background", DRACULA_CURRENT)
-        self.option_add("*TCombobox*Listbox.foreground", DRACULA_FG)
-        self.option_add("*TCombobox*Listbox.selectBackground", DRACULA_PURPLE)
-        self.option_add("*TCombobox*Listbox.selectForeground", DRACULA_FG)
-        self.option_add("*TCombobox*Listbox.font", ("Segoe UI", 11))
+        self.root.option_add("*TCombobox*Listbox.background", DRACULA_CURRENT)
+        self.root.option_add("*TCombobox*Listbox.foreground", DRACULA_FG)
+        self.root.option_add("*TCombobox*Listbox.selectBackground", DRACULA_PURPLE)
+        self.root.option_add("*TCombobox*Listbox.selectForeground", DRACULA_FG)
+        self.root.option_add("*TCombobox*Listbox.font", ("Segoe UI", 11))
 
         self.style.configure(
             "TProgressbar",
@@ -123,6 +147,26 @@ class MainWindow(tk.Tk):
             thickness=12,
         )
 
+        self.style.configure(
+            "Execute.TButton",
+            font=("Segoe UI", 13, "bold"),
+            background=DRACULA_GREEN,
+            foreground=DRACULA_BG,
+            borderwidth=0,
+            relief="flat",
+            padding=(40, 12),
+        )
+
+        self.style.map(
+            "Execute.TButton",
+            background=[
+                ("disabled", DRACULA_COMMENT),
+                ("active", DRACULA_CYAN),
+                ("!active", DRACULA_GREEN),
+            ],
+            foreground=[("active", DRACULA_BG)],
+        )
+
     def _setup_ui(self) -> None:
         """Configura todos os componentes da interface."""
         self._create_header()
@@ -135,7 +179,7 @@ class MainWindow(tk.Tk):
 
     def _create_header(self) -> None:
         """Cria o cabecalho com estilo Dracula."""
-        header_frame = ttk.Frame(self, style="Dark.TFrame")
+        header_frame = ttk.Frame(self.root, style="Dark.TFrame")
         header_frame.pack(fill="x", padx=30, pady=(30, 15))
 
         title_label = ttk.Label(
@@ -154,7 +198,7 @@ class MainWindow(tk.Tk):
 
     def _create_operation_selector(self) -> None:
         """Cria o seletor de operacao."""
-        selector_frame = ttk.Frame(self, style="Dark.TFrame")
+        selector_frame = ttk.Frame(self.root, style="Dark.TFrame")
         selector_frame.pack(fill="x", padx=30, pady=10)
 
         label = ttk.Label(
@@ -186,7 +230,7 @@ class MainWindow(tk.Tk):
 
     def _create_file_input(self) -> None:
         """Cria o campo de entrada de arquivo com placeholder."""
-        file_frame = ttk.Frame(self, style="Dark.TFrame")
+        file_frame = ttk.Frame(self.root, style="Dark.TFrame")
         file_frame.pack(fill="x", padx=30, pady=10)
 
         label = ttk.Label(
@@ -238,7 +282,7 @@ class MainWindow(tk.Tk):
 
     def _create_options_frame(self) -> None:
         """Cria frame de opcoes adicionais."""
-        options_frame = ttk.Frame(self, style="Dark.TFrame")
+        options_frame = ttk.Frame(self.root, style="Dark.TFrame")
         options_frame.pack(fill="x", padx=30, pady=10)
 
         label = ttk.Label(
@@ -304,29 +348,18 @@ class MainWindow(tk.Tk):
 
     def _create_action_buttons(self) -> None:
         """Cria os botoes de acao."""
-        button_frame = ttk.Frame(self, style="Dark.TFrame")
+        button_frame = ttk.Frame(self.root, style="Dark.TFrame")
         button_frame.pack(fill="x", padx=30, pady=20)
 
-        self.execute_btn = tk.Button(
+        self.execute_btn = ttk.Button(
             button_frame,
             text="Executar",
-            font=("Segoe UI", 13, "bold"),
-            bg=DRACULA_GREEN,
-            fg=DRACULA_BG,
-            activebackground=DRACULA_CYAN,
-            activeforeground=DRACULA_BG,
-            relief="flat",
+            style="Execute.TButton",
             cursor="hand2",
             command=self._on_execute_click,
-            padx=40,
-            pady=12,
-            bd=0,
         )
         self.execute_btn.pack(side="left")
 
-        self.execute_btn.bind("<Enter>", lambda e: self.execute_btn.configure(bg=DRACULA_CYAN))
-        self.execute_btn.bind("<Leave>", lambda e: self.execute_btn.configure(bg=DRACULA_GREEN))
-
         self.clear_btn = tk.Button(
             button_frame,
             text="Limpar Log",
@@ -346,7 +379,7 @@ class MainWindow(tk.Tk):
 
     def _create_log_area(self) -> None:
         """Cria a area de log/output com estilo Dracula."""
-        log_frame = ttk.Frame(self, style="Dark.TFrame")
+        log_frame = ttk.Frame(self.root, style="Dark.TFrame")
         log_frame.pack(fill="both", expand=True, padx=30, pady=(0, 10))
 
         log_label = ttk.Label(
@@ -373,7 +406,7 @@ class MainWindow(tk.Tk):
             fg=DRACULA_GREEN,
             insertbackground=DRACULA_FG,
             relief="flat",
-            state="disabled",
+            state="normal",
             wrap="word",
             padx=12,
             pady=12,
@@ -391,6 +424,9 @@ class MainWindow(tk.Tk):
         self.log_textbox.tag_configure("success", foreground=DRACULA_GREEN)
         self.log_textbox.tag_configure("info", foreground=DRACULA_CYAN)
 
+        self.log_textbox.bind("<Key>", self._block_log_edit)
+        for sequence in ("<<Paste>>", "<<PasteSelection>>", "<<Cut>>"):
+            self.log_textbox.bind(sequence, lambda e: "break")
         self.log_textbox.bind("<Control-a>", self._select_all_log)
         self.log_textbox.bind("<Control-A>", self._select_all_log)
         self.log_textbox.bind("<Control-c>", self._copy_log)
@@ -401,7 +437,7 @@ class MainWindow(tk.Tk):
 
     def _create_progress_bar(self) -> None:
         """Cria a barra de progresso."""
-        progress_frame = ttk.Frame(self, style="Dark.TFrame")
+        progress_frame = ttk.Frame(self.root, style="Dark.TFrame")
         progress_frame.pack(fill="x", padx=30, pady=(0, 25))
 
         self.progress_var = tk.DoubleVar(value=0)
@@ -417,7 +453,7 @@ class MainWindow(tk.Tk):
     def _create_context_menu(self) -> None:
         """Cria menu de contexto (botao direito) para area de log."""
         self.context_menu = tk.Menu(
-            self,
+            self.root,
             tearoff=0,
             bg=DRACULA_CURRENT,
             fg=DRACULA_FG,
@@ -453,6 +489,8 @@ class MainWindow(tk.Tk):
 
     def _browse_file(self) -> None:
         """Abre dialogo de selecao de arquivo."""
+        from tkinter import filedialog
+
         filepath = filedialog.askopenfilename(
             title="Selecionar arquivo XML",
             filetypes=[
@@ -483,69 +521,77 @@ class MainWindow(tk.Tk):
 
     def log(self, message: str, level: str = "info") -> None:
         """Adiciona mensagem a area de log com estilo opcional."""
-        self.log_textbox.configure(state="normal")
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_textbox.insert("end", f"[{timestamp}] ", "info")
-        self.log_textbox.insert("end", f"{message}\n", level)
+        prefix = datetime.now().strftime("[%H:%M:%S] ")
+        self.log_textbox.insert("end", prefix, "info", message + "\n", level)
         self.log_textbox.see("end")
-        self.log_textbox.configure(state="disabled")
-        self._log_messages.append(f"[{timestamp}] {message}")
-        self.update()
+        self._log_messages.append(prefix + message)
+        self.root.update()
 
     def set_progress(self, value: float) -> None:
         """Define o valor da barra de progresso (0.0 a 1.0)."""
         self.progress_var.set(value * 100)
-        self.update()
+        self.root.update()
 
     def set_button_state(self, enabled: bool) -> None:
         """Habilita ou desabilita o botao de execucao."""
         if enabled:
-            self.execute_btn.configure(state="normal", bg=DRACULA_GREEN)
+            self.execute_btn.state(["!disabled"])
         else:
-            self.execute_btn.configure(state="disabled", bg=DRACULA_COMMENT)
+            self.execute_btn.state(["disabled"])
 
     def get_month_year(self) -> tuple[int, int]:
         """Parseia o mes/ano selecionado e retorna como (year, month)."""
-        month_year = self.month_var.get()
-        parts = month_year.split("/")
-        month = int(parts[0])
-        year = int(parts[1])
-        return year, month
+        month_str, _, year_str = self.month_var.get().partition("/")
+        return int(year_str), int(month_str)
 
     def set_on_generate(self, callback: Callable) -> None:
         """Define o callback para o botao de execucao."""
         self._on_generate_callback = callback
 
+    def mainloop(self) -> None:
+        """Inicia o loop de eventos da janela raiz."""
+        self.root.mainloop()
+
     def _clear_log(self) -> None:
         """Limpa a area de log."""
-        self.log_textbox.configure(state="normal")
         self.log_textbox.delete("1.0", tk.END)
-        self.log_textbox.configure(state="disabled")
         self._log_messages.clear()
 
+    def _block_log_edit(self, event: tk.Event) -> str | None:
+        """Bloqueia teclas de edicao no log, deixando navegacao e selecao livres."""
+        state = event.state if isinstance(event.state, int) else 0
+        if event.keysym == "Tab" and not state & _SHIFT_MASK:
+            next_widget = self.log_textbox.tk_focusNext()
+            if next_widget is not None:
+                next_widget.focus_set()
+            return "break"
+        if event.keysym in _LOG_EDIT_KEYSYMS:
+            return "break"
+        if event.char and event.char.isprintable() and not state & _CONTROL_MASK:
+            return "break"
+        return None
+
     def _select_all_log(self, event: Optional[tk.Event] = None) -> str:
         """Seleciona todo o texto na area de log."""
-        self.log_textbox.configure(state="normal")
         self.log_textbox.tag_add("sel", "1.0", "end")
-        self.log_textbox.configure(state="disabled")
         return "break"
 
     def _copy_log(self, event: Optional[tk.Event] = None) -> str:
         """Copia texto selecionado para a area de transferencia."""
         try:
-            self.log_textbox.configure(state="normal")
             selected = self.log_textbox.get("sel.first", "sel.last")
-            self.clipboard_clear()
-            self.clipboard_append(selected)
-            self.log_textbox.configure(state="disabled")
+            self.root.clipboard_clear()
+            self.root.clipboard_append(selected)
         except tk.TclError:
             all_text = self.log_textbox.get("1.0", "end-1c")
-            self.clipboard_clear()
-            self.clipboard_append(all_text)
+            self.root.clipboard_clear()
+            self.root.clipboard_append(all_text)
         return "break"
 
     def _export_log(self) -> None:
         """Exporta log para um arquivo texto."""
+        from tkinter import filedialog
+
         filepath = filedialog.asksaveasfilename(
             defaultextension=".txt",
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
@@ -6,9 +6,10 @@ Suporta texto simples e expressoes regulares.
 import logging
 import re
 import tkinter as tk
+from bisect import bisect_right
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,151 @@ DRACULA_PURPLE = "#bd93f9"
 DRACULA_RED = "#ff5555"
 DRACULA_YELLOW = "#f1fa8c"
 
+PATTERN_CACHE_SIZE = 32
+PREVIEW_CHARS = 5000
+
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _line_starts(text: str) -> list[int]:
+    """Retorna o offset de inicio de cada linha do texto."""
+    starts = [0]
+    pos = text.find("\n")
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = text.find("\n", pos + 1)
+    return starts
+
+
+def _text_index(line_starts: list[int], offset: int) -> str:
+    """Converte um offset de caractere em indice Tk no formato linha.coluna."""
+    line = bisect_right(line_starts, offset) - 1
+    return f"{line + 1}.{offset - line_starts[line]}"
+
+
+def _literal_alternatives(search_text: str) -> Optional[list[str]]:
+    """Retorna os termos de uma alternancia de literais (ex: a|b|c), ou None."""
+    if "|" not in search_text:
+        return None
+    words = search_text.split("|")
+    if any(not word or not _REGEX_METACHARS.isdisjoint(word) for word in words):
+        return None
+    return words
+
+
+def _prefix_free(words: list[str], ignore_case: bool) -> bool:
+    """Indica se nenhum termo e prefixo de outro.
+
+    Sem prefixos, no maximo um termo casa em cada posicao, e a trie (termo mais longo)
+    encontra as mesmas ocorrencias que a alternancia do re (primeiro termo que casa).
+    Sem sensibilidade a maiusculas so aceita termos ASCII, cuja comparacao em minusculas
+    equivale a do re (fora do ASCII ha equivalencias como "ſ" e "s").
+    """
+    if ignore_case and not all(word.isascii() for word in words):
+        return False
+    keys = sorted({word.lower() if ignore_case else word for word in words})
+    return not any(longer.startswith(shorter) for shorter, longer in zip(keys, keys[1:]))
+
+
+def _trie_regex(words: list[str], ignore_case: bool) -> str:
+    """Monta uma regex em trie para os termos, fatorando prefixos comuns.
+
+    O motor de re testa alternativas uma a uma; a trie descarta todos os termos de um
+    prefixo com um unico caractere. Casa sempre o termo mais longo na posicao, por isso
+    so equivale a alternancia original quando os termos sao livres de prefixo.
+    """
+    trie: dict[str, dict] = {}
+    for word in words:
+        if ignore_case and word.isascii():
+            word = word.lower()
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _trie_node_regex(trie)
+
+
+def _trie_node_regex(node: dict[str, dict]) -> str:
+    """Converte um no da trie (e seus filhos) em regex."""
+    branches = [re.escape(char) + _trie_node_regex(child) for char, child in node.items() if char]
+    if not branches:
+        return ""
+    optional = "" in node
+    if len(branches) == 1 and not optional:
+        return branches[0]
+    group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if optional else group
+
+
+class _LiteralMatch:
+    """Ocorrencia de busca literal com a mesma interface basica de re.Match."""
+
+    __slots__ = ("_start", "_end")
+
+    def __init__(self, start: int, end: int) -> None:
+        self._start = start
+        self._end = end
+
+    def start(self) -> int:
+        return self._start
+
+    def end(self) -> int:
+        return self._end
+
+    def span(self) -> tuple[int, int]:
+        return self._start, self._end
+
+
+class _LiteralPattern:
+    """Busca de texto literal via str.find, compativel com o uso de re.Pattern no dialogo.
+
+    Sem sensibilidade a maiusculas, compara o texto em minusculas quando ele e ASCII;
+    caso contrario delega ao re para manter os offsets corretos. Quem ja tem o texto
+    em minusculas pode passa-lo em ``lowered`` para evitar a conversao a cada busca.
+    """
+
+    def __init__(self, needle: str, ignore_case: bool) -> None:
+        self.pattern = needle
+        self.flags = re.IGNORECASE if ignore_case else 0
+        self._ignore_case = ignore_case
+        self._needle = needle.lower() if ignore_case else needle
+        self._fallback = re.compile(re.escape(needle), re.IGNORECASE) if ignore_case else None
+
+    def _spans(self, text: str, lowered: Optional[str] = None) -> Iterator[tuple[int, int]]:
+        """Gera (inicio, fim) de cada ocorrencia nao sobreposta."""
+        if self._fallback is not None:
+            if not (text.isascii() and self.pattern.isascii()):
+                for match in self._fallback.finditer(text):
+                    yield match.span()
+                return
+            text = lowered if lowered is not None else text.lower()
+
+        needle = self._needle
+        size = len(needle)
+        pos = text.find(needle)
+        while pos != -1:
+            yield pos, pos + size
+            pos = text.find(needle, pos + size)
+
+    def finditer(self, text: str, lowered: Optional[str] = None) -> Iterator[_LiteralMatch]:
+        for start, end in self._spans(text, lowered):
+            yield _LiteralMatch(start, end)
+
+    def subn(self, repl: str, text: str, lowered: Optional[str] = None) -> tuple[str, int]:
+        """Substitui cada ocorrencia por repl, inserido literalmente."""
+        if not self._ignore_case:
+            count = text.count(self._needle)
+            return (text.replace(self._needle, repl) if count else text), count
+
+        parts: list[str] = []
+        last = 0
+        for start, end in self._spans(text, lowered):
+            parts.append(text[last:start])
+            parts.append(repl)
+            last = end
+        parts.append(text[last:])
+        return "".join(parts), len(parts) // 2
+
 
 class SearchReplaceDialog(tk.Toplevel):
     """Dialogo de busca e substituicao com suporte a regex."""
@@ -37,7 +183,11 @@ class SearchReplaceDialog(tk.Toplevel):
 
         self._content = content
         self._original_content = content
+        self._shown_preview: Optional[str] = None
         self._match_count = 0
+        self._pattern_cache: dict[tuple[str, bool, bool, bool], re.Pattern | _LiteralPattern] = {}
+        self._last_key: Optional[tuple[str, bool, bool, bool]] = None
+        self._last_pattern: Optional[re.Pattern | _LiteralPattern] = None
         self._on_apply_callback: Optional[Callable[[str], None]] = None
 
         self._setup_ui()
@@ -108,6 +258,9 @@ class SearchReplaceDialog(tk.Toplevel):
         self.case_sensitive_var = tk.BooleanVar(value=False)
         self.regex_var = tk.BooleanVar(value=False)
         self.whole_word_var = tk.BooleanVar(value=False)
+        for var in (self.case_sensitive_var, self.regex_var, self.whole_word_var):
+            var.trace_add("write", self._on_option_changed)
+        self._on_option_changed()
 
         case_cb = tk.Checkbutton(
             options_frame,
@@ -148,6 +301,14 @@ class SearchReplaceDialog(tk.Toplevel):
         )
         word_cb.pack(side="left")
 
+    def _on_option_changed(self, *_args: object) -> None:
+        """Espelha as opcoes em Python para evitar leituras Tcl a cada busca."""
+        self._options = (
+            self.case_sensitive_var.get(),
+            self.regex_var.get(),
+            self.whole_word_var.get(),
+        )
+
     def _create_buttons(self) -> None:
         """Cria botoes de acao."""
         button_frame = tk.Frame(self, bg=DRACULA_BG)
@@ -255,25 +416,81 @@ class SearchReplaceDialog(tk.Toplevel):
         )
         self.status_label.pack(fill="x", side="bottom")
 
-    def _build_pattern(self, search_text: str) -> Optional[re.Pattern]:
+    def _set_preview(self, text: str) -> None:
+        """Substitui o texto do preview em uma unica operacao do widget.
+
+        Se o preview ja exibe o mesmo objeto, apenas remove os destaques anteriores.
+        """
+        if text is self._shown_preview:
+            self.preview_text.tag_remove("match", "1.0", tk.END)
+            return
+        self._shown_preview = text
+        self.preview_text.configure(state="normal")
+        self.preview_text.replace("1.0", tk.END, text)
+        self.preview_text.configure(state="disabled")
+
+    def _build_pattern(self, search_text: str) -> Optional[re.Pattern | _LiteralPattern]:
         """Constroi o padrao de busca baseado nas opcoes."""
         if not search_text:
             return None
 
-        flags = 0 if self.case_sensitive_var.get() else re.IGNORECASE
+        case_sensitive, regex_mode, whole_word = self._options
+        key = (search_text, case_sensitive, regex_mode, whole_word)
+        if key == self._last_key:
+            return self._last_pattern
+
+        cached = self._pattern_cache.get(key)
+        if cached is not None:
+            self._last_key, self._last_pattern = key, cached
+            return cached
 
-        if self.regex_var.get():
+        flags = 0 if case_sensitive else re.IGNORECASE
+
+        pattern: re.Pattern | _LiteralPattern
+        if regex_mode:
+            source = search_text
+            alternatives = _literal_alternatives(search_text)
+            if alternatives and _prefix_free(alternatives, not case_sensitive):
+                source = _trie_regex(alternatives, not case_sensitive)
             try:
-                return re.compile(search_text, flags)
+                pattern = re.compile(source, flags)
             except re.error as exc:
                 self.status_label.configure(text=f"Regex invalido: {exc}")
                 return None
-
-        escaped = re.escape(search_text)
-        if self.whole_word_var.get():
-            escaped = rf"\b{escaped}\b"
-
-        return re.compile(escaped, flags)
+        elif not whole_word:
+            pattern = _LiteralPattern(search_text, ignore_case=not case_sensitive)
+        else:
+            pattern = re.compile(rf"\b{re.escape(search_text)}\b", flags)
+
+        if len(self._pattern_cache) >= PATTERN_CACHE_SIZE:
+            del self._pattern_cache[next(iter(self._pattern_cache))]
+        self._pattern_cache[key] = pattern
+        self._last_key, self._last_pattern = key, pattern
+        return pattern
+
+    @property
+    def _content(self) -> str:
+        """Conteudo atual manipulado pelo dialogo."""
+        return self._current_content
+
+    @_content.setter
+    def _content(self, value: str) -> None:
+        self._current_content = value
+        self._preview_slice: Optional[str] = None
+        self._preview_line_starts: Optional[list[int]] = None
+        self._lowered_content: Optional[str] = None
+
+    def _preview(self) -> str:
+        """Retorna o trecho exibido no preview, fatiado uma vez por conteudo."""
+        if self._preview_slice is None:
+            self._preview_slice = self._current_content[:PREVIEW_CHARS]
+        return self._preview_slice
+
+    def _lowered(self) -> Optional[str]:
+        """Retorna o conteudo em minusculas (apenas ASCII), calculado uma vez por conteudo."""
+        if self._lowered_content is None and self._current_content.isascii():
+            self._lowered_content = self._current_content.lower()
+        return self._lowered_content
 
     def _find(self) -> None:
         """Executa busca e destaca ocorrencias no preview."""
@@ -283,30 +500,39 @@ class SearchReplaceDialog(tk.Toplevel):
         if pattern is None:
             return
 
-        matches = list(pattern.finditer(self._content))
-        self._match_count = len(matches)
-
-        self.preview_text.configure(state="normal")
-        self.preview_text.delete("1.0", tk.END)
+        preview_spans: list[tuple[int, int]] = []
+        self._match_count = 0
+        matches: Iterator[re.Match | _LiteralMatch]
+        if isinstance(pattern, _LiteralPattern) and pattern.flags:
+            matches = pattern.finditer(self._content, self._lowered())
+        else:
+            matches = pattern.finditer(self._content)
+        for match in matches:
+            self._match_count += 1
+            if match.end() <= PREVIEW_CHARS:
+                preview_spans.append(match.span())
 
         if self._match_count == 0:
-            self.preview_text.insert("1.0", self._content[:2000])
+            self._set_preview(self._preview()[:2000])
             self.status_label.configure(text="Nenhuma ocorrencia encontrada")
         else:
-            preview_content = self._content[:5000]
-            self.preview_text.insert("1.0", preview_content)
-
-            for match in pattern.finditer(preview_content):
-                start_idx = f"1.0+{match.start()}c"
-                end_idx = f"1.0+{match.end()}c"
-                self.preview_text.tag_add("match", start_idx, end_idx)
+            preview_content = self._preview()
+            self._set_preview(preview_content)
+
+            if self._preview_line_starts is None:
+                self._preview_line_starts = _line_starts(preview_content)
+            line_starts = self._preview_line_starts
+            ranges: list[str] = []
+            for start, end in preview_spans:
+                ranges.append(_text_index(line_starts, start))
+                ranges.append(_text_index(line_starts, end))
+            if ranges:
+                self.preview_text.tag_add("match", *ranges)
 
             self.status_label.configure(
                 text=f"{self._match_count} ocorrencia(s) encontrada(s)"
             )
 
-        self.preview_text.configure(state="disabled")
-
     def _replace_all(self) -> None:
         """Executa substituicao em todo o conteudo."""
         search_text = self.search_entry.get()
@@ -316,14 +542,18 @@ class SearchReplaceDialog(tk.Toplevel):
         if pattern is None:
             return
 
-        new_content, count = pattern.subn(replace_text, self._content)
+        if isinstance(pattern, _LiteralPattern):
+            lowered = self._lowered() if pattern.flags else None
+            new_content, count = pattern.subn(replace_text, self._content, lowered)
+        elif self._options[1]:
+            new_content, count = pattern.subn(replace_text, self._content)
+        else:
+            # Fora do modo regex a substituicao e sempre literal (sem \n, \1, \g<0>)
+            new_content, count = pattern.subn(lambda _match: replace_text, self._content)
         self._content = new_content
         self._match_count = count
 
-        self.preview_text.configure(state="normal")
-        self.preview_text.delete("1.0", tk.END)
-        self.preview_text.insert("1.0", new_content[:5000])
-        self.preview_text.configure(state="disabled")
+        self._set_preview(self._preview())
 
         self.status_label.configure(
             text=f"{count} substituicao(oes) realizada(s)"
@@ -333,11 +563,9 @@ class SearchReplaceDialog(tk.Toplevel):
 
     def _reset(self) -> None:
         """Restaura o conteudo original."""
-        self._content = self._original_content
-        self.preview_text.configure(state="normal")
-        self.preview_text.delete("1.0", tk.END)
-        self.preview_text.insert("1.0", self._content[:5000])
-        self.preview_text.configure(state="disabled")
+        if self._content is not self._original_content:
+            self._content = self._original_content
+        self._set_preview(self._preview())
         self.status_label.configure(text="Conteudo restaurado ao original")
 
     def _apply(self) -> None:
@@ -350,10 +578,7 @@ class SearchReplaceDialog(tk.Toplevel):
         """Define o conteudo a ser manipulado."""
         self._content = content
         self._original_content = content
-        self.preview_text.configure(state="normal")
-        self.preview_text.delete("1.0", tk.END)
-        self.preview_text.insert("1.0", content[:5000])
-        self.preview_text.configure(state="disabled")
+        self._set_preview(self._preview())
 
     def set_on_apply(self, callback: Callable[[str], None]) -> None:
         """Define callback chamado ao aplicar alteracoes."""
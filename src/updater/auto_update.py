@@ -5,24 +5,31 @@ Suporta repositorios Git e endpoints HTTP para distribuicao de releases.
 """
 import json
 import logging
+import re
 import subprocess
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 from urllib.request import Request, urlopen
-from urllib.error import URLError
+from urllib.error import HTTPError, URLError
 
 logger = logging.getLogger(__name__)
 
 CURRENT_VERSION = "1.0.0"
 VERSION_FILE = "version.json"
+UPDATE_CACHE_FILE = ".update_cache.json"
 UPDATE_CHECK_URL = ""
+MAX_MANIFEST_BYTES = 64 * 1024
 
+_SEMVER_RE = re.compile(r"\s*v?(\d+)\.(\d+)\.(\d+)\s*$")
+_URL_RE = re.compile(r"^https?://[^\s/$.?#][^\s]*$", re.IGNORECASE)
+_HEADERS = {"User-Agent": "QoL-Alteryx-ODI-Updater/1.0"}
 
-@dataclass
-class VersionInfo:
-    """Informacoes de uma versao."""
+
+class VersionInfo(NamedTuple):
+    """Informacoes de uma versao, comparavel como tupla (major, minor, patch)."""
     major: int
     minor: int
     patch: int
@@ -30,19 +37,8 @@ class VersionInfo:
     def __str__(self) -> str:
         return f"{self.major}.{self.minor}.{self.patch}"
 
-    def __gt__(self, other: "VersionInfo") -> bool:
-        return (self.major, self.minor, self.patch) > (other.major, other.minor, other.patch)
-
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, VersionInfo):
-            return NotImplemented
-        return (self.major, self.minor, self.patch) == (other.major, other.minor, other.patch)
-
-    def __ge__(self, other: "VersionInfo") -> bool:
-        return self == other or self > other
-
 
-@dataclass
+@dataclass(slots=True)
 class UpdateCheckResult:
     """Resultado da verificacao de atualizacao."""
     update_available: bool
@@ -53,22 +49,27 @@ class UpdateCheckResult:
     error: str = ""
 
 
+@lru_cache(maxsize=128)
 def parse_version(version_str: str) -> VersionInfo:
     """Parseia uma string de versao no formato semver."""
-    version_str = version_str.strip().lstrip("v")
-    parts = version_str.split(".")
-
-    if len(parts) != 3:
+    match = _SEMVER_RE.match(version_str)
+    if match is None:
         raise ValueError(f"Formato de versao invalido: {version_str}")
+    return VersionInfo(*map(int, match.groups()))
+
 
+@lru_cache(maxsize=8)
+def _load_version(version_path: Path) -> str:
+    """Le a versao registrada em version.json, memoizada por caminho."""
     try:
-        return VersionInfo(
-            major=int(parts[0]),
-            minor=int(parts[1]),
-            patch=int(parts[2]),
-        )
-    except ValueError as exc:
-        raise ValueError(f"Componente de versao nao numerico: {version_str}") from exc
+        with open(version_path, "rb") as f:
+            data = json.loads(f.read())
+    except FileNotFoundError:
+        return CURRENT_VERSION
+    except (json.JSONDecodeError, KeyError) as exc:
+        logger.warning("Erro ao ler version.json: %s", exc)
+        return CURRENT_VERSION
+    return data.get("version", CURRENT_VERSION)
 
 
 def compare_versions(current: str, latest: str) -> int:
@@ -95,15 +96,7 @@ class AutoUpdater:
 
     def _load_current_version(self) -> str:
         """Carrega a versao atual do projeto."""
-        version_path = self._root_dir / VERSION_FILE
-        if version_path.exists():
-            try:
-                with open(version_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                return data.get("version", CURRENT_VERSION)
-            except (json.JSONDecodeError, KeyError) as exc:
-                logger.warning("Erro ao ler version.json: %s", exc)
-        return CURRENT_VERSION
+        return _load_version(self._root_dir / VERSION_FILE)
 
     def check_for_updates(self, url: str = "") -> UpdateCheckResult:
         """Verifica se ha atualizacoes disponiveis."""
@@ -118,10 +111,36 @@ class AutoUpdater:
             logger.info("Verificacao de atualizacao ignorada: URL nao configurada")
             return result
 
+        if not _URL_RE.match(check_url):
+            result.error = "URL invalida"
+            logger.warning("URL de verificacao invalida: %s", check_url)
+            return result
+
         try:
-            req = Request(check_url, headers={"User-Agent": "QoL-Alteryx-ODI-Updater/1.0"})
-            with urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode("utf-8"))
+            headers = _HEADERS
+            cached = self._load_update_cache(check_url)
+            if cached is not None:
+                headers = {**_HEADERS, "If-None-Match": cached["etag"]}
+
+            req = Request(check_url, headers=headers)
+            try:
+                with urlopen(req, timeout=10) as response:
+                    raw = response.read(MAX_MANIFEST_BYTES + 1)
+                    etag = response.headers.get("ETag", "")
+
+                if len(raw) > MAX_MANIFEST_BYTES:
+                    result.error = f"Manifesto excede o limite de {MAX_MANIFEST_BYTES} bytes"
+                    logger.warning("Manifesto de atualizacao muito grande, ignorado")
+                    return result
+
+                data = json.loads(raw)
+                if etag:
+                    self._save_update_cache(check_url, etag, data)
+            except HTTPError as exc:
+                if exc.code != 304 or cached is None:
+                    raise
+                logger.info("Manifesto de atualizacao inalterado (304), usando cache")
+                data = cached["manifest"]
 
             latest_version = data.get("version", "")
             if not latest_version:
@@ -158,6 +177,32 @@ class AutoUpdater:
 
         return result
 
+    def _load_update_cache(self, url: str) -> Optional[dict]:
+        """Carrega ETag e manifesto da ultima verificacao HTTP para a mesma URL."""
+        try:
+            with open(self._root_dir / UPDATE_CACHE_FILE, "rb") as f:
+                cached = json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+        if (
+            not isinstance(cached, dict)
+            or cached.get("url") != url
+            or not cached.get("etag")
+            or not isinstance(cached.get("manifest"), dict)
+        ):
+            return None
+        return cached
+
+    def _save_update_cache(self, url: str, etag: str, manifest: dict) -> None:
+        """Persiste ETag e manifesto para requisicoes condicionais futuras."""
+        data = {"url": url, "etag": etag, "manifest": manifest}
+        try:
+            with open(self._root_dir / UPDATE_CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+        except OSError as exc:
+            logger.warning("Falha ao salvar cache de atualizacao: %s", exc)
+
     def check_git_updates(self) -> UpdateCheckResult:
         """Verifica atualizacoes via git (para desenvolvimento)."""
         result = UpdateCheckResult(
@@ -178,14 +223,6 @@ class AutoUpdater:
                 result.error = "Repositorio git nao encontrado ou sem remote"
                 return result
 
-            status_result = subprocess.run(
-                ["git", "status", "-uno", "--porcelain"],
-                cwd=str(self._root_dir),
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-
             log_result = subprocess.run(
                 ["git", "log", "HEAD..origin/main", "--oneline"],
                 cwd=str(self._root_dir),
@@ -221,6 +258,7 @@ class AutoUpdater:
         }
         with open(version_path, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+        _load_version.cache_clear()
         logger.info("Versao salva: %s", version)
 
     @property
@@ -0,0 +1,52 @@
+"""
+Fixtures compartilhadas pela suite de testes.
+Parsers e conversores vivem durante toda a sessao, reaproveitando o cache de parsing.
+"""
+from collections.abc import Callable
+from functools import cache
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from src.core.alteryx_parser import AlteryxParser
+from src.core.converter import AlteryxToOdiConverter, OdiToAlteryxConverter
+from src.core.odi_parser import OdiParser
+
+
+@pytest.fixture(scope="session")
+def alteryx_parser() -> AlteryxParser:
+    """Retorna o parser Alteryx compartilhado pela sessao."""
+    return AlteryxParser()
+
+
+@pytest.fixture(scope="session")
+def odi_parser() -> OdiParser:
+    """Retorna o parser ODI compartilhado pela sessao."""
+    return OdiParser()
+
+
+@pytest.fixture(scope="session")
+def a2o_converter() -> AlteryxToOdiConverter:
+    """Retorna o conversor Alteryx -> ODI compartilhado pela sessao."""
+    return AlteryxToOdiConverter()
+
+
+@pytest.fixture(scope="session")
+def o2a_converter() -> OdiToAlteryxConverter:
+    """Retorna o conversor ODI -> Alteryx compartilhado pela sessao."""
+    return OdiToAlteryxConverter()
+
+
+@cache
+def _parse_xml(content: str) -> ET.Element:
+    """Parseia um XML de saida uma unica vez por conteudo."""
+    return ET.fromstring(content)
+
+
+@pytest.fixture(scope="session")
+def parse_xml() -> Callable[[str], ET.Element]:
+    """Retorna ET.fromstring memoizado; a arvore devolvida e compartilhada, somente leitura."""
+    return _parse_xml
+
+
+# "Nao se repita." - Andy Hunt e Dave Thomas
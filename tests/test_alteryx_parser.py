@@ -10,7 +10,7 @@ import pytest
 from src.core.alteryx_parser import AlteryxParser, AlteryxWorkflow
 
 
-SAMPLE_ALTERYX_XML = """<?xml version="1.0"?>
+SAMPLE_ALTERYX_XML = b"""<?xml version="1.0"?>
 <AlteryxDocument yxmdVer="2024.1">
   <Properties>
     <MetaInfo>
@@ -66,18 +66,24 @@ SAMPLE_ALTERYX_XML = """<?xml version="1.0"?>
 </AlteryxDocument>"""
 
 
-@pytest.fixture
-def sample_yxmd_file(tmp_path: Path) -> Path:
-    """Cria um arquivo .yxmd temporario para testes."""
-    filepath = tmp_path / "test_workflow.yxmd"
-    filepath.write_text(SAMPLE_ALTERYX_XML, encoding="utf-8")
+@pytest.fixture(scope="session")
+def sample_yxmd_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Cria um arquivo .yxmd temporario compartilhado pela sessao de testes."""
+    filepath = tmp_path_factory.mktemp("alteryx") / "test_workflow.yxmd"
+    filepath.write_bytes(SAMPLE_ALTERYX_XML)
     return filepath
 
 
-@pytest.fixture
-def parser() -> AlteryxParser:
-    """Retorna instancia do parser."""
-    return AlteryxParser()
+@pytest.fixture(scope="session")
+def sample_xml_bytes() -> bytes:
+    """Retorna o XML de exemplo em bytes, sem recodificacao."""
+    return SAMPLE_ALTERYX_XML
+
+
+@pytest.fixture(scope="session")
+def parser(alteryx_parser: AlteryxParser) -> AlteryxParser:
+    """Retorna o parser compartilhado pela sessao (cache reaproveitado)."""
+    return alteryx_parser
 
 
 class TestAlteryxParser:
@@ -147,8 +153,9 @@ class TestAlteryxParser:
         workflow2 = parser.parse(sample_yxmd_file)
         assert workflow1 is workflow2
 
-    def test_clear_cache(self, parser: AlteryxParser, sample_yxmd_file: Path) -> None:
+    def test_clear_cache(self, sample_yxmd_file: Path) -> None:
         """Verifica limpeza de cache."""
+        parser = AlteryxParser()
         parser.parse(sample_yxmd_file)
         parser.clear_cache()
         assert len(parser._cache) == 0
@@ -168,9 +175,16 @@ class TestAlteryxParser:
 
     def test_parse_from_string(self, parser: AlteryxParser) -> None:
         """Verifica parsing a partir de string XML."""
-        workflow = parser.parse_from_string(SAMPLE_ALTERYX_XML)
+        workflow = parser.parse_from_string(SAMPLE_ALTERYX_XML.decode("utf-8"))
+        assert workflow.node_count == 3
+        assert workflow.connection_count == 2
+
+    def test_parse_from_bytes(self, parser: AlteryxParser, sample_xml_bytes: bytes) -> None:
+        """Verifica parsing direto de bytes, sem decodificar para string."""
+        workflow = parser.parse_from_string(sample_xml_bytes)
         assert workflow.node_count == 3
         assert workflow.connection_count == 2
+        assert workflow.properties["meta_Name"] == "TestWorkflow"
 
     def test_find_nodes_by_type(self, parser: AlteryxParser, sample_yxmd_file: Path) -> None:
         """Verifica busca de nodes por tipo de plugin."""
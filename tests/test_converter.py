@@ -4,10 +4,12 @@ Verifica conversao bidirecional entre Alteryx e ODI, mapeamento de tools/steps
 e integridade do XML gerado.
 """
 from pathlib import Path
+from typing import Callable
 from xml.etree import ElementTree as ET
 
 import pytest
 
+from src.core.alteryx_parser import AlteryxParser
 from src.core.converter import (
     AlteryxToOdiConverter,
     ConversionResult,
@@ -17,7 +19,7 @@ from src.core.converter import (
 )
 
 
-SAMPLE_ALTERYX_XML = """<?xml version="1.0"?>
+SAMPLE_ALTERYX_XML = b"""<?xml version="1.0"?>
 <AlteryxDocument yxmdVer="2024.1">
   <Properties>
     <MetaInfo>
@@ -68,7 +70,7 @@ SAMPLE_ALTERYX_XML = """<?xml version="1.0"?>
   </Connections>
 </AlteryxDocument>"""
 
-SAMPLE_ODI_XML = """<?xml version="1.0"?>
+SAMPLE_ODI_XML = b"""<?xml version="1.0"?>
 <OdiPackage Name="PKG_TEST" Version="1.0">
   <Description>Package de teste para conversao</Description>
   <Steps>
@@ -90,137 +92,188 @@ SAMPLE_ODI_XML = """<?xml version="1.0"?>
 </OdiPackage>"""
 
 
-@pytest.fixture
-def alteryx_file(tmp_path: Path) -> Path:
-    """Cria arquivo Alteryx temporario."""
-    filepath = tmp_path / "workflow.yxmd"
-    filepath.write_text(SAMPLE_ALTERYX_XML, encoding="utf-8")
+@pytest.fixture(scope="module")
+def alteryx_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Cria arquivo Alteryx temporario, compartilhado pelo modulo."""
+    filepath = tmp_path_factory.mktemp("alteryx") / "workflow.yxmd"
+    filepath.write_bytes(SAMPLE_ALTERYX_XML)
     return filepath
 
 
-@pytest.fixture
-def odi_file(tmp_path: Path) -> Path:
-    """Cria arquivo ODI temporario."""
-    filepath = tmp_path / "package.xml"
-    filepath.write_text(SAMPLE_ODI_XML, encoding="utf-8")
+@pytest.fixture(scope="module")
+def odi_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Cria arquivo ODI temporario, compartilhado pelo modulo."""
+    filepath = tmp_path_factory.mktemp("odi") / "package.xml"
+    filepath.write_bytes(SAMPLE_ODI_XML)
     return filepath
 
 
 class TestAlteryxToOdiConverter:
     """Testes de conversao Alteryx -> ODI."""
 
-    def test_convert_success(self, alteryx_file: Path) -> None:
+    def test_convert_success(
+        self, a2o_converter: AlteryxToOdiConverter, alteryx_file: Path
+    ) -> None:
         """Verifica conversao bem-sucedida."""
-        converter = AlteryxToOdiConverter()
-        result = converter.convert(alteryx_file)
+        result = a2o_converter.convert(alteryx_file)
         assert result.success is True
         assert result.xml_content
 
-    def test_convert_generates_valid_xml(self, alteryx_file: Path) -> None:
+    def test_convert_generates_valid_xml(
+        self,
+        a2o_converter: AlteryxToOdiConverter,
+        alteryx_file: Path,
+        parse_xml: Callable[[str], ET.Element],
+    ) -> None:
         """Verifica que XML gerado e valido."""
-        converter = AlteryxToOdiConverter()
-        result = converter.convert(alteryx_file)
-        root = ET.fromstring(result.xml_content)
+        result = a2o_converter.convert(alteryx_file)
+        root = parse_xml(result.xml_content)
         assert root.tag == "OdiPackage"
 
-    def test_convert_preserves_name(self, alteryx_file: Path) -> None:
+    def test_convert_preserves_name(
+        self,
+        a2o_converter: AlteryxToOdiConverter,
+        alteryx_file: Path,
+        parse_xml: Callable[[str], ET.Element],
+    ) -> None:
         """Verifica que nome do workflow e preservado."""
-        converter = AlteryxToOdiConverter()
-        result = converter.convert(alteryx_file)
-        root = ET.fromstring(result.xml_content)
+        result = a2o_converter.convert(alteryx_file)
+        root = parse_xml(result.xml_content)
         assert root.get("Name") == "workflow"
 
-    def test_convert_maps_tools_to_steps(self, alteryx_file: Path) -> None:
+    def test_convert_maps_tools_to_steps(
+        self,
+        a2o_converter: AlteryxToOdiConverter,
+        alteryx_file: Path,
+        parse_xml: Callable[[str], ET.Element],
+    ) -> None:
         """Verifica mapeamento de tools para steps."""
-        converter = AlteryxToOdiConverter()
-        result = converter.convert(alteryx_file)
-        root = ET.fromstring(result.xml_content)
+        result = a2o_converter.convert(alteryx_file)
+        root = parse_xml(result.xml_content)
         steps = list(root.iter("Step"))
         assert len(steps) == 3
 
-    def test_convert_stats(self, alteryx_file: Path) -> None:
+    def test_convert_stats(self, a2o_converter: AlteryxToOdiConverter, alteryx_file: Path) -> None:
         """Verifica estatisticas de conversao."""
-        converter = AlteryxToOdiConverter()
-        result = converter.convert(alteryx_file)
+        result = a2o_converter.convert(alteryx_file)
         assert result.stats["tools_converted"] == 3
         assert result.stats["connections"] == 2
 
-    def test_convert_with_output_file(self, alteryx_file: Path, tmp_path: Path) -> None:
+    def test_convert_with_output_file(
+        self, a2o_converter: AlteryxToOdiConverter, alteryx_file: Path, tmp_path: Path
+    ) -> None:
         """Verifica gravacao em arquivo de saida."""
-        converter = AlteryxToOdiConverter()
         output_path = tmp_path / "output_odi.xml"
-        result = converter.convert(alteryx_file, output_path)
+        result = a2o_converter.convert(alteryx_file, output_path)
         assert result.output_path == output_path
         assert output_path.exists()
 
-    def test_convert_file_not_found(self) -> None:
+    def test_convert_pretty(
+        self,
+        a2o_converter: AlteryxToOdiConverter,
+        alteryx_file: Path,
+        parse_xml: Callable[[str], ET.Element],
+    ) -> None:
+        """Verifica que a indentacao so ocorre quando solicitada."""
+        compact = a2o_converter.convert(alteryx_file).xml_content
+        pretty = a2o_converter.convert(alteryx_file, pretty=True).xml_content
+        assert "\n  <Steps>" not in compact
+        assert "\n  <Steps>" in pretty
+        assert parse_xml(pretty).tag == parse_xml(compact).tag
+
+    def test_convert_file_not_found(self, a2o_converter: AlteryxToOdiConverter) -> None:
         """Verifica erro com arquivo inexistente."""
-        converter = AlteryxToOdiConverter()
-        result = converter.convert(Path("/nao/existe.yxmd"))
+        result = a2o_converter.convert(Path("/nao/existe.yxmd"))
         assert result.success is False
         assert len(result.errors) > 0
 
-    def test_convert_includes_connections(self, alteryx_file: Path) -> None:
+    def test_convert_includes_connections(
+        self,
+        a2o_converter: AlteryxToOdiConverter,
+        alteryx_file: Path,
+        parse_xml: Callable[[str], ET.Element],
+    ) -> None:
         """Verifica que conexoes sao mapeadas."""
-        converter = AlteryxToOdiConverter()
-        result = converter.convert(alteryx_file)
-        root = ET.fromstring(result.xml_content)
+        result = a2o_converter.convert(alteryx_file)
+        root = parse_xml(result.xml_content)
         flows = list(root.iter("Flow"))
         assert len(flows) == 2
 
+    def test_convert_from_workflow(
+        self,
+        a2o_converter: AlteryxToOdiConverter,
+        alteryx_parser: AlteryxParser,
+        alteryx_file: Path,
+    ) -> None:
+        """Verifica conversao a partir de workflow ja parseado."""
+        workflow = alteryx_parser.parse(alteryx_file)
+        result = a2o_converter.convert_from_workflow(workflow)
+        assert result.success is True
+        assert result.xml_content == a2o_converter.convert(alteryx_file).xml_content
+
 
 class TestOdiToAlteryxConverter:
     """Testes de conversao ODI -> Alteryx."""
 
-    def test_convert_success(self, odi_file: Path) -> None:
+    def test_convert_success(self, o2a_converter: OdiToAlteryxConverter, odi_file: Path) -> None:
         """Verifica conversao bem-sucedida."""
-        converter = OdiToAlteryxConverter()
-        result = converter.convert(odi_file)
+        result = o2a_converter.convert(odi_file)
         assert result.success is True
         assert result.xml_content
 
-    def test_convert_generates_valid_xml(self, odi_file: Path) -> None:
+    def test_convert_generates_valid_xml(
+        self,
+        o2a_converter: OdiToAlteryxConverter,
+        odi_file: Path,
+        parse_xml: Callable[[str], ET.Element],
+    ) -> None:
         """Verifica que XML Alteryx gerado e valido."""
-        converter = OdiToAlteryxConverter()
-        result = converter.convert(odi_file)
-        root = ET.fromstring(result.xml_content)
+        result = o2a_converter.convert(odi_file)
+        root = parse_xml(result.xml_content)
         assert root.tag == "AlteryxDocument"
 
-    def test_convert_maps_steps_to_nodes(self, odi_file: Path) -> None:
+    def test_convert_maps_steps_to_nodes(
+        self,
+        o2a_converter: OdiToAlteryxConverter,
+        odi_file: Path,
+        parse_xml: Callable[[str], ET.Element],
+    ) -> None:
         """Verifica mapeamento de steps para nodes."""
-        converter = OdiToAlteryxConverter()
-        result = converter.convert(odi_file)
-        root = ET.fromstring(result.xml_content)
+        result = o2a_converter.convert(odi_file)
+        root = parse_xml(result.xml_content)
         nodes = list(root.iter("Node"))
         assert len(nodes) == 3
 
-    def test_convert_assigns_sequential_tool_ids(self, odi_file: Path) -> None:
+    def test_convert_assigns_sequential_tool_ids(
+        self,
+        o2a_converter: OdiToAlteryxConverter,
+        odi_file: Path,
+        parse_xml: Callable[[str], ET.Element],
+    ) -> None:
         """Verifica atribuicao sequencial de ToolIDs."""
-        converter = OdiToAlteryxConverter()
-        result = converter.convert(odi_file)
-        root = ET.fromstring(result.xml_content)
+        result = o2a_converter.convert(odi_file)
+        root = parse_xml(result.xml_content)
         tool_ids = [n.get("ToolID") for n in root.iter("Node")]
         assert tool_ids == ["1", "2", "3"]
 
-    def test_convert_with_output_file(self, odi_file: Path, tmp_path: Path) -> None:
+    def test_convert_with_output_file(
+        self, o2a_converter: OdiToAlteryxConverter, odi_file: Path, tmp_path: Path
+    ) -> None:
         """Verifica gravacao em arquivo de saida."""
-        converter = OdiToAlteryxConverter()
         output_path = tmp_path / "output_alteryx.yxmd"
-        result = converter.convert(odi_file, output_path)
+        result = o2a_converter.convert(odi_file, output_path)
         assert output_path.exists()
         content = output_path.read_text(encoding="utf-8-sig")
         assert "AlteryxDocument" in content
 
-    def test_convert_stats(self, odi_file: Path) -> None:
+    def test_convert_stats(self, o2a_converter: OdiToAlteryxConverter, odi_file: Path) -> None:
         """Verifica estatisticas de conversao."""
-        converter = OdiToAlteryxConverter()
-        result = converter.convert(odi_file)
+        result = o2a_converter.convert(odi_file)
         assert result.stats["steps_converted"] == 3
 
-    def test_convert_file_not_found(self) -> None:
+    def test_convert_file_not_found(self, o2a_converter: OdiToAlteryxConverter) -> None:
         """Verifica erro com arquivo inexistente."""
-        converter = OdiToAlteryxConverter()
-        result = converter.convert(Path("/nao/existe.xml"))
+        result = o2a_converter.convert(Path("/nao/existe.xml"))
         assert result.success is False
 
 
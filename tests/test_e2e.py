@@ -4,6 +4,7 @@ Verifica o fluxo completo: parse -> validate -> convert -> export,
 garantindo que os modulos funcionam em conjunto sem erros.
 """
 from pathlib import Path
+from typing import Callable
 from xml.etree import ElementTree as ET
 
 import pytest
@@ -15,7 +16,7 @@ from src.core.validation import WorkflowValidator, PackageValidator
 from src.cli import run_cli
 
 
-SAMPLE_ALTERYX_XML = """<?xml version="1.0"?>
+SAMPLE_ALTERYX_XML = b"""<?xml version="1.0"?>
 <AlteryxDocument yxmdVer="2024.1">
   <Properties>
     <MetaInfo>
@@ -69,7 +70,7 @@ SAMPLE_ALTERYX_XML = """<?xml version="1.0"?>
   </Connections>
 </AlteryxDocument>"""
 
-SAMPLE_ODI_XML = """<?xml version="1.0"?>
+SAMPLE_ODI_XML = b"""<?xml version="1.0"?>
 <OdiPackage Name="PKG_E2E" Version="1.0">
   <Description>Package de teste end-to-end</Description>
   <Steps>
@@ -94,29 +95,35 @@ SAMPLE_ODI_XML = """<?xml version="1.0"?>
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
-def alteryx_file(tmp_path: Path) -> Path:
-    """Cria arquivo Alteryx temporario para testes e2e."""
-    filepath = tmp_path / "e2e_workflow.yxmd"
-    filepath.write_text(SAMPLE_ALTERYX_XML, encoding="utf-8")
+@pytest.fixture(scope="module")
+def alteryx_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Cria arquivo Alteryx temporario para testes e2e, compartilhado pelo modulo."""
+    filepath = tmp_path_factory.mktemp("alteryx") / "e2e_workflow.yxmd"
+    filepath.write_bytes(SAMPLE_ALTERYX_XML)
     return filepath
 
 
-@pytest.fixture
-def odi_file(tmp_path: Path) -> Path:
-    """Cria arquivo ODI temporario para testes e2e."""
-    filepath = tmp_path / "e2e_package.xml"
-    filepath.write_text(SAMPLE_ODI_XML, encoding="utf-8")
+@pytest.fixture(scope="module")
+def odi_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Cria arquivo ODI temporario para testes e2e, compartilhado pelo modulo."""
+    filepath = tmp_path_factory.mktemp("odi") / "e2e_package.xml"
+    filepath.write_bytes(SAMPLE_ODI_XML)
     return filepath
 
 
 class TestEndToEndAlteryx:
     """Testes e2e para fluxo Alteryx completo."""
 
-    def test_parse_validate_convert_flow(self, alteryx_file: Path, tmp_path: Path) -> None:
+    def test_parse_validate_convert_flow(
+        self,
+        alteryx_parser: AlteryxParser,
+        a2o_converter: AlteryxToOdiConverter,
+        alteryx_file: Path,
+        tmp_path: Path,
+        parse_xml: Callable[[str], ET.Element],
+    ) -> None:
         """Verifica fluxo completo: parse -> validate -> convert."""
-        parser = AlteryxParser()
-        workflow = parser.parse(alteryx_file)
+        workflow = alteryx_parser.parse(alteryx_file)
         assert workflow.node_count == 3
         assert workflow.connection_count == 2
 
@@ -124,14 +131,13 @@ class TestEndToEndAlteryx:
         validation = validator.validate(alteryx_file)
         assert validation.error_count == 0
 
-        converter = AlteryxToOdiConverter()
         output_path = tmp_path / "converted_odi.xml"
-        result = converter.convert(alteryx_file, output_path)
+        result = a2o_converter.convert(alteryx_file, output_path, workflow=workflow)
 
         assert result.success is True
         assert output_path.exists()
 
-        root = ET.fromstring(result.xml_content)
+        root = parse_xml(result.xml_content)
         assert root.tag == "OdiPackage"
         steps = list(root.iter("Step"))
         assert len(steps) == 3
@@ -145,7 +151,7 @@ class TestEndToEndAlteryx:
 
         template_content = SAMPLE_ALTERYX_XML
         template_path = tmp_path / "template.yxmd"
-        template_path.write_text(template_content, encoding="utf-8")
+        template_path.write_bytes(template_content)
 
         content, stats = process_template(
             template_path, "", 2025, 6
@@ -154,6 +160,23 @@ class TestEndToEndAlteryx:
         assert content is not None
         assert isinstance(stats, dict)
 
+    def test_template_processing_cached(self, tmp_path: Path) -> None:
+        """Verifica que reprocessar o mesmo template repete resultado e mensagens de log."""
+        from src.core.xml_processor import process_template
+
+        template_path = tmp_path / "gerar-fechamento-diario.yxmd"
+        template_path.write_bytes(SAMPLE_ALTERYX_XML)
+
+        first_log: list[tuple] = []
+        second_log: list[tuple] = []
+        first = process_template(template_path, "", 2025, 6, lambda *args: first_log.append(args))
+        second = process_template(template_path, "", 2025, 6, lambda *args: second_log.append(args))
+
+        assert first == second
+        assert first[1] is not second[1]
+        assert first_log == second_log
+        assert ("  AVISO: ID 16 nao encontrado", "warning") in first_log
+
     def test_batch_workflow(self, tmp_path: Path) -> None:
         """Verifica processamento em lote de multiplos arquivos."""
         from src.batch.processor import BatchProcessor, BatchConfig
@@ -164,7 +187,7 @@ class TestEndToEndAlteryx:
 
         for i in range(3):
             filepath = input_dir / f"workflow_{i}.yxmd"
-            filepath.write_text(SAMPLE_ALTERYX_XML, encoding="utf-8")
+            filepath.write_bytes(SAMPLE_ALTERYX_XML)
 
         config = BatchConfig(
             input_dir=input_dir,
@@ -179,14 +202,94 @@ class TestEndToEndAlteryx:
         assert result.processed == 3
         assert result.failed == 0
 
-    def test_fixture_file_parse(self) -> None:
+    def test_batch_workflow_parallel(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verifica processamento em lote distribuido entre processos."""
+        from src.batch.processor import BatchProcessor, BatchConfig
+
+        monkeypatch.setenv("QOL_BATCH_WORKERS", "2")
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for i in range(3):
+            (input_dir / f"workflow_{i}.yxmd").write_bytes(SAMPLE_ALTERYX_XML)
+        (input_dir / "workflow_9.yxmd").write_text("<invalido", encoding="utf-8")
+
+        config = BatchConfig(input_dir=input_dir, output_dir=tmp_path / "output")
+        messages: list[tuple[str, str]] = []
+        result = BatchProcessor().process(config, log_fn=lambda m, lvl: messages.append((m, lvl)))
+
+        assert result.processed == 3
+        assert result.failed == 1
+        assert [r["nodes"] for r in result.results] == [3, 3, 3]
+        assert any(level == "error" for _, level in messages)
+
+    def test_batch_parallel_broken_pool(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verifica que um pool quebrado conclui o lote em serie."""
+        from concurrent.futures.process import BrokenProcessPool
+
+        from src.batch import processor
+        from src.batch.processor import BatchConfig, BatchProcessor
+
+        class BrokenExecutor:
+            def __init__(self, *args: object, **kwargs: object) -> None:
+                pass
+
+            def __enter__(self) -> "BrokenExecutor":
+                return self
+
+            def __exit__(self, *exc: object) -> None:
+                return None
+
+            def map(self, *args: object, **kwargs: object) -> None:
+                raise BrokenProcessPool("worker encerrado")
+
+            def shutdown(self, *args: object, **kwargs: object) -> None:
+                return None
+
+        monkeypatch.setenv("QOL_BATCH_WORKERS", "2")
+        monkeypatch.setattr(processor, "ProcessPoolExecutor", BrokenExecutor)
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for i in range(3):
+            (input_dir / f"workflow_{i}.yxmd").write_bytes(SAMPLE_ALTERYX_XML)
+
+        config = BatchConfig(input_dir=input_dir, output_dir=tmp_path / "output")
+        result = BatchProcessor().process(config)
+
+        assert result.processed == 3
+        assert result.failed == 0
+
+    def test_batch_parallel_unpicklable_config(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Verifica que uma tarefa nao serializavel conclui o lote em serie."""
+        from src.batch.processor import BatchConfig, BatchProcessor
+
+        monkeypatch.setenv("QOL_BATCH_WORKERS", "2")
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for i in range(3):
+            (input_dir / f"workflow_{i}.yxmd").write_bytes(SAMPLE_ALTERYX_XML)
+
+        config = BatchConfig(input_dir=input_dir, output_dir=tmp_path / "output")
+        config.on_done = lambda: None  # type: ignore[attr-defined]
+        messages: list[tuple[str, str]] = []
+        result = BatchProcessor().process(config, log_fn=lambda m, lvl: messages.append((m, lvl)))
+
+        assert result.processed == 3
+        assert result.failed == 0
+        assert any(level == "warning" for _, level in messages)
+
+    def test_fixture_file_parse(self, alteryx_parser: AlteryxParser) -> None:
         """Verifica parsing do arquivo fixture sample_workflow."""
         fixture_path = FIXTURES_DIR / "sample_workflow.yxmd"
         if not fixture_path.exists():
             pytest.skip("Fixture sample_workflow.yxmd nao encontrada")
 
-        parser = AlteryxParser()
-        workflow = parser.parse(fixture_path)
+        workflow = alteryx_parser.parse(fixture_path)
         assert workflow.node_count == 4
         assert workflow.connection_count == 3
 
@@ -194,10 +297,15 @@ class TestEndToEndAlteryx:
 class TestEndToEndODI:
     """Testes e2e para fluxo ODI completo."""
 
-    def test_parse_validate_convert_flow(self, odi_file: Path, tmp_path: Path) -> None:
+    def test_parse_validate_convert_flow(
+        self,
+        odi_parser: OdiParser,
+        o2a_converter: OdiToAlteryxConverter,
+        odi_file: Path,
+        tmp_path: Path,
+    ) -> None:
         """Verifica fluxo completo: parse -> validate -> convert ODI."""
-        parser = OdiParser()
-        package = parser.parse(odi_file)
+        package = odi_parser.parse(odi_file)
         assert package.step_count == 3
         assert package.scenario_count == 1
 
@@ -205,9 +313,8 @@ class TestEndToEndODI:
         validation = validator.validate(odi_file)
         assert validation.error_count == 0
 
-        converter = OdiToAlteryxConverter()
         output_path = tmp_path / "converted_alteryx.yxmd"
-        result = converter.convert(odi_file, output_path)
+        result = o2a_converter.convert(odi_file, output_path)
 
         assert result.success is True
         assert output_path.exists()
@@ -219,49 +326,33 @@ class TestEndToEndODI:
 class TestEndToEndCLI:
     """Testes e2e para interface CLI."""
 
-    def test_cli_parse_command(self, alteryx_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_cli_parse_command(self, alteryx_file: Path) -> None:
         """Verifica subcomando parse via CLI."""
-        monkeypatch.setattr(
-            "sys.argv",
-            ["qol-alteryx-odi", "parse", str(alteryx_file), "--format", "json"],
-        )
-        exit_code = run_cli()
+        exit_code = run_cli(["parse", str(alteryx_file), "--format", "json"])
         assert exit_code == 0
 
-    def test_cli_convert_command(
-        self, alteryx_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_cli_convert_command(self, alteryx_file: Path, tmp_path: Path) -> None:
         """Verifica subcomando convert via CLI."""
         output_path = tmp_path / "cli_output.xml"
-        monkeypatch.setattr(
-            "sys.argv",
+        exit_code = run_cli(
             [
-                "qol-alteryx-odi",
                 "convert",
                 str(alteryx_file),
                 "--direction", "a2o",
                 "--output", str(output_path),
-            ],
+            ]
         )
-        exit_code = run_cli()
         assert exit_code == 0
         assert output_path.exists()
 
-    def test_cli_validate_command(
-        self, alteryx_file: Path, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_cli_validate_command(self, alteryx_file: Path) -> None:
         """Verifica subcomando validate via CLI."""
-        monkeypatch.setattr(
-            "sys.argv",
-            ["qol-alteryx-odi", "validate", str(alteryx_file)],
-        )
-        exit_code = run_cli()
+        exit_code = run_cli(["validate", str(alteryx_file)])
         assert exit_code == 0
 
-    def test_cli_no_command_shows_help(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_cli_no_command_shows_help(self) -> None:
         """Verifica que CLI sem subcomando retorna 0."""
-        monkeypatch.setattr("sys.argv", ["qol-alteryx-odi"])
-        exit_code = run_cli()
+        exit_code = run_cli([])
         assert exit_code == 0
 
 
@@ -9,7 +9,7 @@ import pytest
 from src.core.odi_parser import OdiParser, OdiPackage
 
 
-SAMPLE_ODI_XML = """<?xml version="1.0"?>
+SAMPLE_ODI_XML = b"""<?xml version="1.0"?>
 <OdiPackage Name="PKG_ETL_VENDAS" Version="2.0">
   <Description>Package de ETL para vendas mensais</Description>
   <Project>Projeto_DW</Project>
@@ -66,18 +66,24 @@ SAMPLE_ODI_XML = """<?xml version="1.0"?>
 </OdiPackage>"""
 
 
-@pytest.fixture
-def sample_odi_file(tmp_path: Path) -> Path:
-    """Cria um arquivo ODI XML temporario para testes."""
-    filepath = tmp_path / "package_etl.xml"
-    filepath.write_text(SAMPLE_ODI_XML, encoding="utf-8")
+@pytest.fixture(scope="module")
+def sample_odi_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Cria um arquivo ODI XML temporario para testes, compartilhado pelo modulo."""
+    filepath = tmp_path_factory.mktemp("odi") / "package_etl.xml"
+    filepath.write_bytes(SAMPLE_ODI_XML)
     return filepath
 
 
-@pytest.fixture
-def parser() -> OdiParser:
-    """Retorna instancia do parser ODI."""
-    return OdiParser()
+@pytest.fixture(scope="session")
+def parser(odi_parser: OdiParser) -> OdiParser:
+    """Retorna o parser ODI compartilhado pela sessao."""
+    return odi_parser
+
+
+@pytest.fixture(scope="module")
+def parsed_package(parser: OdiParser) -> OdiPackage:
+    """Retorna o package de exemplo parseado em memoria, uma vez por modulo."""
+    return parser.parse_from_string(SAMPLE_ODI_XML)
 
 
 class TestOdiParser:
@@ -89,84 +95,72 @@ class TestOdiParser:
         assert package is not None
         assert package.name == "package_etl"
 
-    def test_parse_step_count(self, parser: OdiParser, sample_odi_file: Path) -> None:
+    def test_parse_step_count(self, parsed_package: OdiPackage) -> None:
         """Verifica contagem de steps."""
-        package = parser.parse(sample_odi_file)
-        assert package.step_count == 5
+        assert parsed_package.step_count == 5
 
-    def test_parse_scenario_count(self, parser: OdiParser, sample_odi_file: Path) -> None:
+    def test_parse_scenario_count(self, parsed_package: OdiPackage) -> None:
         """Verifica contagem de cenarios."""
-        package = parser.parse(sample_odi_file)
-        assert package.scenario_count == 2
+        assert parsed_package.scenario_count == 2
 
-    def test_parse_description(self, parser: OdiParser, sample_odi_file: Path) -> None:
+    def test_parse_description(self, parsed_package: OdiPackage) -> None:
         """Verifica extracao de descricao."""
-        package = parser.parse(sample_odi_file)
-        assert "vendas mensais" in package.description
+        assert "vendas mensais" in parsed_package.description
 
-    def test_parse_project(self, parser: OdiParser, sample_odi_file: Path) -> None:
+    def test_parse_project(self, parsed_package: OdiPackage) -> None:
         """Verifica extracao de projeto."""
-        package = parser.parse(sample_odi_file)
-        assert package.project == "Projeto_DW"
+        assert parsed_package.project == "Projeto_DW"
 
-    def test_parse_steps_data(self, parser: OdiParser, sample_odi_file: Path) -> None:
+    def test_parse_steps_data(self, parsed_package: OdiPackage) -> None:
         """Verifica dados dos steps extraidos."""
-        package = parser.parse(sample_odi_file)
-        step_names = [s.name for s in package.steps]
+        step_names = [s.name for s in parsed_package.steps]
         assert "Extrair_Fonte" in step_names
         assert "Transformar_Dados" in step_names
         assert "Carregar_DW" in step_names
 
-    def test_parse_step_flow(self, parser: OdiParser, sample_odi_file: Path) -> None:
+    def test_parse_step_flow(self, parsed_package: OdiPackage) -> None:
         """Verifica fluxo de sucesso/falha entre steps."""
-        package = parser.parse(sample_odi_file)
-        step = next(s for s in package.steps if s.name == "Extrair_Fonte")
+        step = next(s for s in parsed_package.steps if s.name == "Extrair_Fonte")
         assert step.on_success == "Transformar_Dados"
         assert step.on_failure == "Log_Erro"
 
-    def test_parse_step_scenario_ref(self, parser: OdiParser, sample_odi_file: Path) -> None:
+    def test_parse_step_scenario_ref(self, parsed_package: OdiPackage) -> None:
         """Verifica referencia a cenario no step."""
-        package = parser.parse(sample_odi_file)
-        step = next(s for s in package.steps if s.name == "Transformar_Dados")
+        step = next(s for s in parsed_package.steps if s.name == "Transformar_Dados")
         assert step.target_scenario == "SCN_TRANSFORM"
 
-    def test_parse_scenarios(self, parser: OdiParser, sample_odi_file: Path) -> None:
+    def test_parse_scenarios(self, parsed_package: OdiPackage) -> None:
         """Verifica extracao de cenarios."""
-        package = parser.parse(sample_odi_file)
-        scenario_names = [s.name for s in package.scenarios]
+        scenario_names = [s.name for s in parsed_package.scenarios]
         assert "SCN_TRANSFORM" in scenario_names
         assert "SCN_LOAD" in scenario_names
 
-    def test_parse_scenario_variables(self, parser: OdiParser, sample_odi_file: Path) -> None:
+    def test_parse_scenario_variables(self, parsed_package: OdiPackage) -> None:
         """Verifica variaveis dos cenarios."""
-        package = parser.parse(sample_odi_file)
-        scenario = next(s for s in package.scenarios if s.name == "SCN_TRANSFORM")
+        scenario = next(s for s in parsed_package.scenarios if s.name == "SCN_TRANSFORM")
         assert "V_DATA_REF" in scenario.variables
         assert "V_SCHEMA" in scenario.variables
 
-    def test_parse_interfaces(self, parser: OdiParser, sample_odi_file: Path) -> None:
+    def test_parse_interfaces(self, parsed_package: OdiPackage) -> None:
         """Verifica extracao de interfaces."""
-        package = parser.parse(sample_odi_file)
-        assert len(package.interfaces) == 1
-        iface = package.interfaces[0]
+        assert len(parsed_package.interfaces) == 1
+        iface = parsed_package.interfaces[0]
         assert iface.name == "INT_VENDAS_STG"
         assert iface.source_schema == "SRC"
         assert iface.target_table == "STG_VENDAS"
 
-    def test_parse_interface_mappings(self, parser: OdiParser, sample_odi_file: Path) -> None:
+    def test_parse_interface_mappings(self, parsed_package: OdiPackage) -> None:
         """Verifica mappings da interface."""
-        package = parser.parse(sample_odi_file)
-        iface = package.interfaces[0]
+        iface = parsed_package.interfaces[0]
         assert len(iface.mappings) == 2
         assert iface.mappings[0]["source_col"] == "ID"
         assert iface.mappings[0]["target_col"] == "VENDA_ID"
 
-    def test_parse_variables(self, parser: OdiParser, sample_odi_file: Path) -> None:
+    def test_parse_variables(self, parsed_package: OdiPackage) -> None:
         """Verifica extracao de variaveis globais."""
-        package = parser.parse(sample_odi_file)
-        assert "V_DATA_REF" in package.variables
-        assert package.variables["V_DATA_REF"]["type"] == "DATE"
-        assert package.variables["V_DATA_REF"]["default"] == "2024-01-01"
+        assert "V_DATA_REF" in parsed_package.variables
+        assert parsed_package.variables["V_DATA_REF"]["type"] == "DATE"
+        assert parsed_package.variables["V_DATA_REF"]["default"] == "2024-01-01"
 
     def test_parse_file_not_found(self, parser: OdiParser) -> None:
         """Verifica erro ao parsear arquivo inexistente."""
@@ -179,15 +173,26 @@ class TestOdiParser:
         pkg2 = parser.parse(sample_odi_file)
         assert pkg1 is pkg2
 
-    def test_clear_cache(self, parser: OdiParser, sample_odi_file: Path) -> None:
+    def test_cache_invalidated_on_change(self, parser: OdiParser, tmp_path: Path) -> None:
+        """Verifica que alterar o arquivo no disco descarta o package em cache."""
+        filepath = tmp_path / "package_alterado.xml"
+        filepath.write_bytes(SAMPLE_ODI_XML)
+        pkg1 = parser.parse(filepath)
+        filepath.write_bytes(SAMPLE_ODI_XML.replace(b"Projeto_DW", b"Projeto_DW_V2"))
+        pkg2 = parser.parse(filepath)
+        assert pkg2 is not pkg1
+        assert pkg2.project == "Projeto_DW_V2"
+
+    def test_clear_cache(self, sample_odi_file: Path) -> None:
         """Verifica limpeza de cache."""
+        parser = OdiParser()
         parser.parse(sample_odi_file)
         parser.clear_cache()
         assert len(parser._cache) == 0
 
     def test_parse_from_string(self, parser: OdiParser) -> None:
         """Verifica parsing a partir de string."""
-        package = parser.parse_from_string(SAMPLE_ODI_XML)
+        package = parser.parse_from_string(SAMPLE_ODI_XML.decode("utf-8"))
         assert package.step_count == 5
         assert package.scenario_count == 2
 
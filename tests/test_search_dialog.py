@@ -0,0 +1,107 @@
+"""
+Testes para os auxiliares de busca do dialogo de busca e substituicao.
+Compara os atalhos (trie, busca literal) com o resultado do re; nao dependem de Tk.
+"""
+import re
+
+import pytest
+
+from src.gui.search_dialog import (
+    _literal_alternatives,
+    _LiteralPattern,
+    _prefix_free,
+    _trie_regex,
+)
+
+
+def _spans(pattern: str, text: str, flags: int = 0) -> list[tuple[int, int]]:
+    """Retorna os spans de re.finditer para comparacao."""
+    return [match.span() for match in re.finditer(pattern, text, flags)]
+
+
+class TestTrieRegex:
+    """Testes da regex em trie para alternancias de literais."""
+
+    @pytest.mark.parametrize(
+        "search_text,text,ignore_case",
+        [
+            ("foo|bar|baz", "foo bar baz bazaar fob", False),
+            ("cat|dog|cow", "CatDOGcowcat", True),
+            ("alpha|beta|gamma", "gammabetaalphabeta", False),
+            ("ab|ac|bc", "abacbcABAC", True),
+        ],
+    )
+    def test_matches_re_when_prefix_free(
+        self, search_text: str, text: str, ignore_case: bool
+    ) -> None:
+        """Termos livres de prefixo geram as mesmas ocorrencias que o re."""
+        words = _literal_alternatives(search_text)
+        assert words is not None
+        assert _prefix_free(words, ignore_case)
+
+        flags = re.IGNORECASE if ignore_case else 0
+        assert _spans(_trie_regex(words, ignore_case), text, flags) == _spans(
+            search_text, text, flags
+        )
+
+    @pytest.mark.parametrize(
+        "search_text,ignore_case",
+        [
+            ("foo|foobar", False),
+            ("c|a|aa", True),
+            ("AB|abc", True),
+            ("café|CAFÉS", True),
+        ],
+    )
+    def test_rejects_prefixes(self, search_text: str, ignore_case: bool) -> None:
+        """Termos que sao prefixo de outros nao usam a trie (re casa o primeiro termo)."""
+        words = _literal_alternatives(search_text)
+        assert words is not None
+        assert not _prefix_free(words, ignore_case)
+
+    def test_case_sensitive_prefix_check(self) -> None:
+        """Com sensibilidade a maiusculas, diferenca de caixa nao forma prefixo."""
+        assert _prefix_free(["AB", "abc"], ignore_case=False)
+
+    def test_non_literal_alternation(self) -> None:
+        """Alternancias com metacaracteres nao sao tratadas como literais."""
+        assert _literal_alternatives("fo+|bar") is None
+        assert _literal_alternatives("foo") is None
+        assert _literal_alternatives("foo||bar") is None
+
+
+class TestLiteralPattern:
+    """Testes da busca literal via str.find comparada ao re com re.escape."""
+
+    CASES: list[tuple[str, str, bool]] = [
+        ("a.b", "a.b axb A.B a.ba.b", False),
+        ("a.b", "a.b axb A.B a.ba.b", True),
+        ("aa", "aaaaa AAaA", True),
+        ("Cafe", "cafe CAFE Cafe", True),
+        ("é", "É é e", True),
+        ("(x)", "(x) (X) x", False),
+    ]
+
+    @pytest.mark.parametrize("needle,text,ignore_case", CASES)
+    def test_finditer_matches_re(self, needle: str, text: str, ignore_case: bool) -> None:
+        """As ocorrencias batem com as do re, com ou sem texto em minusculas."""
+        flags = re.IGNORECASE if ignore_case else 0
+        expected = _spans(re.escape(needle), text, flags)
+        pattern = _LiteralPattern(needle, ignore_case)
+
+        assert [m.span() for m in pattern.finditer(text)] == expected
+        if ignore_case and text.isascii():
+            lowered = text.lower()
+            assert [m.span() for m in pattern.finditer(text, lowered)] == expected
+
+    @pytest.mark.parametrize("needle,text,ignore_case", CASES)
+    def test_subn_matches_re(self, needle: str, text: str, ignore_case: bool) -> None:
+        """A substituicao bate com re.subn usando substituicao literal."""
+        flags = re.IGNORECASE if ignore_case else 0
+        repl = r"\g<0>\n\1"
+        expected = re.subn(re.escape(needle), lambda _match: repl, text, flags=flags)
+
+        assert _LiteralPattern(needle, ignore_case).subn(repl, text) == expected
+
+
+# "Se nao esta testado, esta quebrado." - Bruce Eckel